@@ -9,69 +9,10 @@ import time
 from pathlib import Path
 import queue
 
-class NumberToWords:
-    # Convert numbers to their written word form.
-    
-    def __init__(self):
-        self.ones = ['', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
-        self.teens = ['ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 
-                     'sixteen', 'seventeen', 'eighteen', 'nineteen']
-        self.tens = ['', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety']
-        self.scales = ['', 'thousand', 'million', 'billion', 'trillion', 'quadrillion','quintillion']
-    
-    def convert_under_thousand(self, num: int) -> str:
-        # Convert numbers under 1000 to words.
-        if num == 0:
-            return ''
-        
-        result = ''
-        
-        # Handle hundreds
-        if num >= 100:
-            result += self.ones[num // 100] + ' hundred'
-            num %= 100
-            if num > 0:
-                result += ' '
-        
-        # Handle tens and ones
-        if num >= 20:
-            result += self.tens[num // 10]
-            if num % 10 > 0:
-                result += ' ' + self.ones[num % 10]
-        elif num >= 10:
-            result += self.teens[num - 10]
-        elif num > 0:
-            result += self.ones[num]
-        
-        return result
-    
-    def convert(self, num: int) -> str:
-        # Convert any number to words.
-        if num == 0:
-            return 'zero'
-        
-        if num < 0:
-            return 'negative ' + self.convert(-num)
-        
-        result = ''
-        scale_index = 0
-        
-        while num > 0:
-            chunk = num % 1000
-            if chunk > 0:
-                chunk_words = self.convert_under_thousand(chunk)
-                if scale_index > 0:
-                    chunk_words += ' ' + self.scales[scale_index]
-                
-                if result:
-                    result = chunk_words + ' ' + result
-                else:
-                    result = chunk_words
-            
-            num //= 1000
-            scale_index += 1
-        
-        return result
+from number_words import (NumberToWords, CHECKPOINT_INTERVAL, write_checkpoint,
+                          remove_checkpoint, prepare_resume, preallocate, generate_sharded,
+                          codec_for_path, write_compressed, GenerationStats,
+                          ProgressSampler, PipelinedWriter, write_sorted)
 
 class NumberGeneratorGUI:
     def __init__(self, root):
@@ -164,6 +105,46 @@ class NumberGeneratorGUI:
                                font=('Courier', 11), width=10)
         batch_entry.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
         
+        # Output mode
+        ttk.Label(input_frame, text="Output Mode:", style='Header.TLabel').grid(
+            row=3, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        
+        self.block_output_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(input_frame, text="Fast block writer (binary, \\n line endings)",
+                        variable=self.block_output_var).grid(
+            row=3, column=1, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        # Worker processes
+        ttk.Label(input_frame, text="Worker Processes:", style='Header.TLabel').grid(
+            row=4, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        
+        self.workers_var = tk.StringVar(value="1")
+        workers_entry = ttk.Entry(input_frame, textvariable=self.workers_var, 
+                                 font=('Courier', 11), width=10)
+        workers_entry.grid(row=4, column=1, sticky=tk.W, pady=(10, 0))
+        
+        # Line order
+        ttk.Label(input_frame, text="Line Order:", style='Header.TLabel').grid(
+            row=5, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        
+        self.sorted_output_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(input_frame, text="Alphabetical (sorted in bounded memory, no resume)",
+                        variable=self.sorted_output_var).grid(
+            row=5, column=1, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        # Step
+        ttk.Label(input_frame, text="Step:", style='Header.TLabel').grid(
+            row=6, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        
+        self.step_var = tk.StringVar(value="1")
+        step_frame = ttk.Frame(input_frame)
+        step_frame.grid(row=6, column=1, columnspan=2, sticky=tk.W, pady=(10, 0))
+        ttk.Entry(step_frame, textvariable=self.step_var, font=('Courier', 11),
+                  width=10).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(step_frame,
+                  text="every Nth number from 1 (above 1: single worker, no resume)").grid(
+            row=0, column=1, sticky=tk.W, padx=(10, 0))
+        
         # Control buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=2, column=0, columnspan=3, pady=(0, 15))
@@ -177,9 +158,13 @@ class NumberGeneratorGUI:
                                   command=self.stop_generation, state='disabled')
         self.stop_btn.grid(row=0, column=1, padx=(0, 10))
         
+        self.resume_btn = ttk.Button(button_frame, text="⏯ Resume", 
+                                    command=self.resume_generation)
+        self.resume_btn.grid(row=0, column=2, padx=(0, 10))
+        
         self.test_btn = ttk.Button(button_frame, text="🧪 Test Convert", 
                                   command=self.test_conversion)
-        self.test_btn.grid(row=0, column=2)
+        self.test_btn.grid(row=0, column=3)
         
         # Progress section
         progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="15")
@@ -224,17 +209,15 @@ class NumberGeneratorGUI:
         # Show welcome information.
         info = """Welcome to the Numbers to Words Generator!
 
-📊 ESTIMATED FILE SIZES:
-• 1,000 numbers ≈ 25 KB
-• 10,000 numbers ≈ 250 KB  
-• 100,000 numbers ≈ 2.5 MB
-• 1,000,000 numbers ≈ 25 MB
-• 10,000,000 numbers ≈ 250 MB
+📊 FILE SIZES:
+{file_sizes}
 
 ⚡ PERFORMANCE TIPS:
 • Use larger batch sizes (50,000+) for better performance on large ranges
-• Generation speed: ~100,000 numbers per minute on modern hardware
-• Files are saved incrementally, so you can stop and resume
+• Generation speed: millions of numbers per second with the block writer
+  (measure yours with benchmarks/run_benchmarks.py)
+• Files are checkpointed as they are written: after Stop or a crash,
+  select the same output file and click 'Resume' to continue
 
 🎯 QUICK START:
 1. Choose an end number (or use quick select buttons)
@@ -249,12 +232,17 @@ three
 ...
 """
         
+        file_sizes = '\n'.join(
+            f"• {count:,} numbers = {self.format_size(self.converter.output_size(1, count) / (1024 * 1024))}"
+            for count in (1000, 10000, 100000, 1000000, 10000000))
+        info = info.replace('{file_sizes}', file_sizes)
+        
         self.info_text.delete(1.0, tk.END)
         self.info_text.insert(1.0, info)
     def format_size(self, size_in_mb: float) -> str:
         # Format size from MB into KB, GB, TB, PB, EB as needed.
-        units = ["MB", "GB", "TB", "PB", "EB"]
-        size = size_in_mb
+        units = ["KB", "MB", "GB", "TB", "PB", "EB"]
+        size = size_in_mb * 1024
         unit_index = 0
         
         while size >= 1024 and unit_index < len(units) - 1:
@@ -295,7 +283,9 @@ three
         filename = filedialog.asksaveasfilename(
             title="Save output as…",
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            filetypes=[("Text files", "*.txt"), ("Compressed (gzip)", "*.gz"),
+                       ("Compressed (bzip2)", "*.bz2"), ("Compressed (xz)", "*.xz"),
+                       ("All files", "*.*")],
             initialfile=default_name,          # <-- was 'initialvalue', use 'initialfile'
             initialdir=os.path.expanduser("~/Desktop"),  # optional, pick a sensible default
             confirmoverwrite=True              # optional, prompts if file exists
@@ -328,8 +318,8 @@ three
         def convert_and_show():
             try:
                 test_num = int(test_entry.get().replace(',', ''))
-                if test_num < 0 or test_num > 999999999999999999999:
-                    result_label.config(text="Number out of range (0 to 999 quadrillion)")
+                if test_num < 0 or test_num >= 10 ** 306:
+                    result_label.config(text="Number out of range (0 to 999 centillion)")
                     return
                 
                 words = self.converter.convert(test_num)
@@ -383,6 +373,8 @@ three
         try:
             end_number = int(self.end_number_var.get().replace(',', ''))
             batch_size = int(self.batch_size_var.get().replace(',', ''))
+            workers = int(self.workers_var.get().replace(',', ''))
+            step = int(self.step_var.get().replace(',', ''))
             
             if end_number < 1 or end_number > 999999999999999999999:
                 messagebox.showerror("Error", "End number must be between 1 and 999,999,999,999,999")
@@ -392,6 +384,20 @@ three
                 messagebox.showerror("Error", "Batch size must be positive")
                 return
             
+            if workers < 1:
+                messagebox.showerror("Error", "Worker processes must be positive")
+                return
+            
+            if step < 1:
+                messagebox.showerror("Error", "Step must be positive")
+                return
+            
+            if step > 1 and (workers > 1 or self.sorted_output_var.get()
+                             or codec_for_path(self.output_file_var.get().strip())):
+                messagebox.showerror("Error", "A step above 1 needs a single worker process, "
+                                              "unsorted lines and an uncompressed file")
+                return
+            
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers")
             return
@@ -400,93 +406,189 @@ three
         output_file = self.output_file_var.get().strip()
         if not output_file:
             output_file = f"numbers_1_to_{end_number:,}_longhand.txt".replace(',', '_')
+            if step > 1:
+                output_file = output_file.replace('_longhand', f'_step_{step}_longhand')
             self.output_file_var.set(output_file)
         
-        # Estimate file size and warn if large
-        avg_chars = self.estimate_avg_chars(end_number)
-        estimated_mb = (end_number * avg_chars) / (1024 * 1024)
+        # Work out the file size (exact, or about 1/step of it) and warn if large
+        output_mb = self.converter.output_size(1, end_number) / step / (1024 * 1024)
         
-        if estimated_mb > 1000:  # > 1GB
-            readable_size = self.format_size(estimated_mb)
+        if output_mb > 1000:  # > 1GB
+            readable_size = self.format_size(output_mb)
             result = messagebox.askyesno(
                 "Large File Warning", 
-                f"Estimated file size: {readable_size}\n"
+                f"File size: {readable_size}\n"
                 f"This may take a long time and use significant disk space.\n\n"
                 f"Continue with generation?"
             )
             if not result:
                 return
         
-        # Start generation
+        remove_checkpoint(output_file)
+        self.launch_generation(end_number, output_file, batch_size, workers, step=step)
+    
+    def resume_generation(self):
+        # Continue a stopped or crashed generation from its checkpoint.
+        if self.is_generating:
+            return
+        
+        output_file = self.output_file_var.get().strip()
+        if not output_file:
+            messagebox.showerror("Error", "Choose the output file to resume")
+            return
+        
+        # A sorted file is rewritten from the start, so there is nothing to
+        # continue; check this before prepare_resume truncates anything.
+        if self.sorted_output_var.get():
+            messagebox.showerror("Error", "Sorted output cannot be resumed - "
+                                          "clear Alphabetical or generate it again")
+            return
+        
+        try:
+            batch_size = int(self.batch_size_var.get().replace(',', ''))
+            workers = int(self.workers_var.get().replace(',', ''))
+            
+            if batch_size < 1 or workers < 1:
+                messagebox.showerror("Error", "Batch size and worker processes must be positive")
+                return
+            
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers")
+            return
+        
+        try:
+            start_number, end_number = prepare_resume(self.converter, output_file)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Resume Error", str(e))
+            return
+        
+        self.end_number_var.set(str(end_number))
+        self.launch_generation(end_number, output_file, batch_size, workers, start_number)
+    
+    def launch_generation(self, end_number, output_file, batch_size, workers, start_number=1,
+                          step=1):
+        # Start the generation thread for start_number..end_number.
         self.is_generating = True
         self.generate_btn.config(state='disabled')
+        self.resume_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
         
-        self.generation_thread = threading.Thread(
-            target=self.generate_numbers_thread,
-            args=(end_number, output_file, batch_size),
-            daemon=True
-        )
+        if self.sorted_output_var.get():
+            # External merge sort; workers sort runs in parallel.
+            target = self.generate_sorted_thread
+            args = (end_number, output_file, workers)
+        elif codec_for_path(output_file):
+            # .gz/.bz2/.xz: framed compression, workers are compression threads.
+            target = self.generate_compressed_thread
+            args = (end_number, output_file, batch_size, workers)
+        elif workers > 1:
+            # Sharded generation always uses the bytes block writer.
+            target = self.generate_parallel_thread
+            args = (end_number, output_file, batch_size, workers, start_number)
+        else:
+            target = self.generate_numbers_thread
+            args = (end_number, output_file, batch_size, self.block_output_var.get(),
+                    start_number, step)
+        
+        self.generation_thread = threading.Thread(target=target, args=args, daemon=True)
         self.generation_thread.start()
     
-    def generate_numbers_thread(self, end_number, output_file, batch_size):
-        # Generate numbers in a separate thread.
+    def generate_numbers_thread(self, end_number, output_file, batch_size, block_output=False,
+                                start_number=1, step=1):
+        # Generate numbers in a separate thread. With start_number > 1 the
+        # output is continued after lines 1..start_number-1 (see prepare_resume).
+        # With step > 1 only every step-th number is written, and no
+        # checkpoints are kept. The loop only records counters; a
+        # ProgressSampler reports them.
         try:
             start_time = time.time()
+            resuming = start_number > 1
+            stats = GenerationStats(start_number, end_number, step)
+            
+            if block_output:
+                # Pre-encoded bytes blocks straight into a binary file.
+                f = open(output_file, 'r+b' if resuming else 'wb')
+                f.seek(0, os.SEEK_END)
+                if step == 1:
+                    preallocate(f, self.converter.output_size(1, end_number))
+                blocks = self.converter.iter_stepped_batches(start_number, end_number + 1, step, 1)
+            elif step == 1:
+                # newline='\n' keeps the file byte-identical on every platform,
+                # which line_offset and the checkpoints rely on.
+                f = open(output_file, 'a' if resuming else 'w', encoding='utf-8', newline='\n')
+                blocks = ((len(block), '\n'.join(block) + '\n')
+                          for block in self.converter.iter_blocks(start_number, end_number + 1))
+            else:
+                f = open(output_file, 'w', encoding='utf-8', newline='\n')
+                blocks = ((count, block.decode('utf-8')) for count, block in
+                          self.converter.iter_stepped_batches(start_number, end_number + 1, step, 1))
             
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with f, ProgressSampler(stats, self.report_progress):
+                # Bytes are batched and written on a PipelinedWriter thread
+                # while the next blocks are converted; text is batched here.
+                writer = PipelinedWriter(f, batch_size, stats=stats) if block_output else None
                 batch = []
+                batch_count = 0
+                i = start_number - 1
+                last_checkpoint = time.time()
+                clock = time.perf_counter
+                converted = clock()
                 
-                for i in range(1, end_number + 1):
+                for count, block in blocks:
                     if not self.is_generating:  # Check for stop
                         break
                     
-                    words = self.converter.convert(i)
-                    batch.append(words + '\n')
+                    i += count
                     
-                    # Write batch to file
-                    if len(batch) >= batch_size:
+                    if writer is not None:
+                        writer.write(block, count)
+                    else:
+                        batch.append(block)
+                        batch_count += count
+                        if batch_count < batch_size:
+                            continue
+                        
+                        # Write batch to file
+                        began = clock()
                         f.writelines(batch)
+                        stats.record(batch_count, sum(map(len, batch)), began - converted,
+                                     clock() - began, block)
                         batch = []
-                        
-                        # Update progress
-                        progress = (i / end_number) * 100
-                        elapsed = time.time() - start_time
-                        rate = i / elapsed if elapsed > 0 else 0
-                        eta = (end_number - i) / rate if rate > 0 else 0
-                        eta_str = self.format_eta(eta)
-
-                        self.progress_queue.put({
-                            'progress': progress,
-                            'status': f"Generated {i:,} / {end_number:,} ({progress:.1f}%) - "
-                                      f"{rate:.0f} numbers/sec - ETA: {eta_str}",
-                            'preview': '\n'.join(batch[-10:]) if batch else words
-                        })
+                        batch_count = 0
+                    
+                    # Record a checkpoint once the data is on disk
+                    if step == 1 and time.time() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                        (writer or f).flush()
+                        os.fsync(f.fileno())
+                        write_checkpoint(output_file, end_number, i,
+                                         self.converter.line_offset(i + 1))
+                        last_checkpoint = time.time()
+                    
+                    converted = clock()
                 
-                # Write remaining batch
-                if batch and self.is_generating:
+                # Write what is left, including after a stop so nothing is lost
+                if writer is not None:
+                    writer.close()
+                elif batch:
+                    began = clock()
                     f.writelines(batch)
+                    stats.record(batch_count, sum(map(len, batch)), began - converted,
+                                 clock() - began, batch[-1])
+                
+                if block_output:
+                    f.truncate()  # drop any preallocated space left after a stop
             
             # Final update
             if self.is_generating:
-                elapsed = time.time() - start_time
-                file_size_mb = os.path.getsize(output_file) / (1024 * 1024)
-                file_size_str = self.format_size(file_size_mb)
-                elapsed_str = self.format_eta(elapsed)   # ✅ add this line
-
+                remove_checkpoint(output_file)
+                self.report_complete(end_number, output_file, start_time, start_number, step)
+            elif step > 1:
                 self.progress_queue.put({
-                    'complete': True,
-                    'progress': 100,
-                    'status': f"Complete! Generated {end_number:,} numbers in {elapsed_str} "
-                              f"({file_size_str})",
-                    'info': f"✅ GENERATION COMPLETE!\n\n"
-                           f"Numbers generated: {end_number:,}\n"
-                           f"Output file: {output_file}\n"
-                           f"File size: {file_size_str}\n"
-                           f"Generation time: {elapsed_str}\n"
-                           f"Average rate: {end_number/elapsed:.0f} numbers/second\n\n"
-                           f"The file contains one number per line written in words."
+                    'status': f"Stopped after {i - start_number + 1:,} / "
+                              f"{len(range(start_number, end_number + 1, step)):,} numbers"
                 })
+            else:
+                self.report_stopped(i, end_number, output_file)
             
         except Exception as e:
             self.progress_queue.put({
@@ -498,6 +600,202 @@ three
         finally:
             self.progress_queue.put({'finished': True})
     
+    def generate_parallel_thread(self, end_number, output_file, batch_size, workers,
+                                 start_number=1):
+        # Generate numbers on a process pool (see generate_sharded). Shards are
+        # written to part files next to the output and merged in order; a
+        # checkpoint is recorded as the merged prefix grows.
+        try:
+            start_time = time.time()
+            stats = GenerationStats(start_number, end_number)
+            last_checkpoint = time.time()
+            
+            def on_progress(done):
+                stats.set_totals(done, self.converter.output_size(start_number,
+                                                                  start_number + done - 1))
+            
+            def on_merged(copied):
+                # Record a checkpoint once the merged lines are on disk
+                nonlocal last_checkpoint
+                if time.time() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                    last = start_number - 1 + copied
+                    out.flush()
+                    os.fsync(out.fileno())
+                    write_checkpoint(output_file, end_number, last,
+                                     self.converter.line_offset(last + 1))
+                    last_checkpoint = time.time()
+            
+            with open(output_file, 'r+b' if start_number > 1 else 'wb') as out, \
+                    ProgressSampler(stats, self.report_progress):
+                out.seek(0, os.SEEK_END)
+                preallocate(out, self.converter.output_size(1, end_number))
+                written = generate_sharded(out, start_number, end_number + 1, workers,
+                                           output_file, batch_size, on_progress,
+                                           should_stop=lambda: not self.is_generating,
+                                           on_merged=on_merged)
+                out.truncate()
+            
+            # Final update
+            if self.is_generating:
+                remove_checkpoint(output_file)
+                self.report_complete(end_number, output_file, start_time, start_number)
+            else:
+                self.report_stopped(start_number - 1 + written, end_number, output_file)
+            
+        except Exception as e:
+            self.progress_queue.put({
+                'error': True,
+                'status': f"Error: {str(e)}",
+                'info': f"❌ ERROR OCCURRED:\n\n{str(e)}\n\nGeneration stopped."
+            })
+        
+        finally:
+            self.progress_queue.put({'finished': True})
+    
+    def generate_compressed_thread(self, end_number, output_file, batch_size, workers):
+        # Generate numbers into a compressed file with a frame index (see
+        # write_compressed); each batch becomes one independently compressed frame.
+        try:
+            start_time = time.time()
+            stats = GenerationStats(1, end_number)
+            
+            def on_progress(done):
+                stats.set_totals(done, self.converter.output_size(1, done))
+            
+            with ProgressSampler(stats, self.report_progress):
+                written = write_compressed(
+                    output_file, 1, end_number + 1, codec_for_path(output_file),
+                    frame_size=batch_size, workers=workers, on_progress=on_progress,
+                    should_stop=lambda: not self.is_generating)
+            
+            # Final update
+            if self.is_generating:
+                self.report_complete(end_number, output_file, start_time)
+            else:
+                self.progress_queue.put({
+                    'status': f"Stopped after {written:,} / {end_number:,} numbers"
+                })
+            
+        except Exception as e:
+            self.progress_queue.put({
+                'error': True,
+                'status': f"Error: {str(e)}",
+                'info': f"❌ ERROR OCCURRED:\n\n{str(e)}\n\nGeneration stopped."
+            })
+        
+        finally:
+            self.progress_queue.put({'finished': True})
+    
+    def generate_sorted_thread(self, end_number, output_file, workers):
+        # Generate numbers in alphabetical order (see write_sorted). Runs are
+        # spilled next to the output file and removed afterwards.
+        try:
+            start_time = time.time()
+            stats = GenerationStats(1, end_number)
+            
+            def on_progress(done):
+                stats.set_totals(done, self.converter.output_size(1, done))
+            
+            with open(output_file, 'wb') as out, ProgressSampler(stats, self.report_progress):
+                preallocate(out, self.converter.output_size(1, end_number))
+                written = write_sorted(out, 1, end_number + 1, workers=workers,
+                                       temp_dir=os.path.dirname(os.path.abspath(output_file)),
+                                       on_progress=on_progress,
+                                       should_stop=lambda: not self.is_generating)
+                out.truncate()
+            
+            # Final update
+            if self.is_generating:
+                remove_checkpoint(output_file)  # left by an earlier unsorted run
+                self.report_complete(end_number, output_file, start_time)
+            else:
+                self.progress_queue.put({
+                    'status': f"Stopped - the sorted file is incomplete "
+                              f"({written:,} / {end_number:,} lines)"
+                })
+            
+        except Exception as e:
+            self.progress_queue.put({
+                'error': True,
+                'status': f"Error: {str(e)}",
+                'info': f"❌ ERROR OCCURRED:\n\n{str(e)}\n\nGeneration stopped."
+            })
+        
+        finally:
+            self.progress_queue.put({'finished': True})
+    
+    def report_progress(self, snapshot):
+        # Queue a progress update from a GenerationStats snapshot; called on
+        # the ProgressSampler thread. The ETA is worked out from bytes rather
+        # than numbers, since later lines are longer.
+        rate = snapshot['rate'] if snapshot['final'] else snapshot['recent_rate']
+        
+        if snapshot['step'] == 1:
+            i = snapshot['last_number']
+            end_number = snapshot['end']
+            progress = (i / end_number) * 100
+            left_bytes = self.converter.output_size(i + 1, end_number)
+            done_bytes = snapshot['bytes']
+            eta = snapshot['elapsed'] * left_bytes / done_bytes if done_bytes > 0 else 0
+        else:
+            # Stepped output has no exact size ahead of time; go by numbers.
+            i = snapshot['numbers']
+            end_number = snapshot['total']
+            progress = snapshot['percent']
+            eta = snapshot['elapsed'] * (end_number - i) / i if i > 0 else 0
+        eta_str = self.format_eta(eta)
+        
+        update = {
+            'progress': progress,
+            'status': f"Generated {i:,} / {end_number:,} ({progress:.1f}%) - "
+                      f"{rate:.0f} numbers/sec - ETA: {eta_str}"
+        }
+        if snapshot['block'] is not None:
+            update['preview'] = self.preview_lines(snapshot['block'])
+        
+        self.progress_queue.put(update)
+    
+    def report_complete(self, end_number, output_file, start_time, start_number=1, step=1):
+        # Queue the final summary once generation has finished.
+        elapsed = time.time() - start_time
+        file_size_mb = os.path.getsize(output_file) / (1024 * 1024)
+        file_size_str = self.format_size(file_size_mb)
+        elapsed_str = self.format_eta(elapsed)
+        generated = len(range(start_number, end_number + 1, step))
+        rate = generated / elapsed if elapsed > 0 else 0
+
+        self.progress_queue.put({
+            'complete': True,
+            'progress': 100,
+            'status': f"Complete! Generated {generated:,} numbers in {elapsed_str} "
+                      f"({file_size_str})",
+            'info': f"✅ GENERATION COMPLETE!\n\n"
+                   f"Numbers generated: {generated:,}\n"
+                   f"Output file: {output_file}\n"
+                   f"File size: {file_size_str}\n"
+                   f"Generation time: {elapsed_str}\n"
+                   f"Average rate: {rate:.0f} numbers/second\n\n"
+                   f"The file contains one number per line written in words."
+        })
+    
+    def report_stopped(self, last_number, end_number, output_file):
+        # Record where a stopped generation got to so it can be resumed.
+        write_checkpoint(output_file, end_number, last_number,
+                         self.converter.line_offset(last_number + 1))
+        
+        self.progress_queue.put({
+            'status': f"Stopped after {last_number:,} / {end_number:,} numbers - "
+                      f"use Resume to continue"
+        })
+    
+    def preview_lines(self, block, count=10):
+        # Return the last few lines of a generated block (str or bytes) as text.
+        if isinstance(block, bytes):
+            lines = [line.decode('utf-8') for line in block[:-1].rsplit(b'\n', count)[-count:]]
+        else:
+            lines = block[:-1].rsplit('\n', count)[-count:]
+        return '\n'.join(lines)
+    
     def stop_generation(self):
         # Stop the generation process.
         self.is_generating = False
@@ -532,6 +830,7 @@ three
                 if 'finished' in update:
                     self.is_generating = False
                     self.generate_btn.config(state='normal')
+                    self.resume_btn.config(state='normal')
                     self.stop_btn.config(state='disabled')
                 
         except queue.Empty:
@@ -539,19 +838,6 @@ three
         
         # Schedule next check
         self.root.after(100, self.check_progress_queue)
-    
-    def estimate_avg_chars(self, end_number):
-        # Estimate average characters per number.
-        if end_number <= 100:
-            return 8
-        elif end_number <= 1000:
-            return 25
-        elif end_number <= 1000000:
-            return 45
-        elif end_number <= 1000000000:
-            return 65
-        else:
-            return 85
 
 def main():
     # Main function to run the GUI application.
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Benchmark: closed-form range statistics against brute force #
+#
+# The correctness check against brute force lives in tests/test_stats.py.
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords
+
+
+def brute_force(converter, start, end):
+    # The same statistics by converting every number in start..end.
+    words = Counter()
+    letters = Counter()
+    lengths = []
+    
+    for num in range(start, end + 1):
+        line = converter.convert(num)
+        words.update(line.split(' '))
+        letters.update(line.replace(' ', ''))
+        lengths.append(len(line))
+    
+    return words, letters, max(lengths), min(lengths)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time range_stats against brute force, then on huge ranges.")
+    parser.add_argument('--end', type=int, default=1000000,
+                        help="END for the timed 1..END comparison (default: 1,000,000)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    
+    start = time.perf_counter()
+    brute_force(converter, 1, args.end)
+    brute_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    converter.range_stats(1, args.end)
+    stats_time = time.perf_counter() - start
+    print(f"1..{args.end:,}: brute force {brute_time:.2f}s, range_stats {stats_time * 1000:.2f}ms")
+    
+    for exponent in (18, 100, 1000):
+        start = time.perf_counter()
+        result = converter.range_stats(1, 10 ** exponent)
+        elapsed = time.perf_counter() - start
+        print(f"1..10**{exponent}: {elapsed * 1000:.1f}ms, "
+              f"longest line {result['longest'][0]:,} characters")
+
+
+if __name__ == '__main__':
+    main()
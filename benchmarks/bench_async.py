@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# Benchmark: event-loop latency while agenerate_file runs #
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words_async import agenerate_file
+
+
+async def measure(end_number, batch_size, path):
+    # Run a 1 ms ticker next to the generator and collect how late it fires.
+    lags = []
+    
+    async def ticker():
+        while True:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - before - 0.001)
+    
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    written = await agenerate_file(path, 1, end_number + 1, batch_size)
+    elapsed = time.perf_counter() - start
+    ticker_task.cancel()
+    
+    lags.sort()
+    return written / elapsed, lags[len(lags) // 2], lags[int(len(lags) * 0.99)], lags[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure throughput and event-loop lag of agenerate_file.")
+    parser.add_argument('--end', type=int, default=5000000, help="numbers to write (default: 5,000,000)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'numbers.txt')
+        print(f"{'batch':>8} {'n/s':>12} {'p50 lag':>9} {'p99 lag':>9} {'max lag':>9}")
+        for batch_size in (1000, 10000, 100000):
+            rate, p50, p99, worst = asyncio.run(measure(args.end, batch_size, path))
+            print(f"{batch_size:>8,} {rate:>12,.0f} {p50 * 1000:>7.2f}ms "
+                  f"{p99 * 1000:>7.2f}ms {worst * 1000:>7.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Benchmark: converting integers with thousands to millions of digits #
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords
+
+
+def convert_by_divmod(converter, num):
+    # The previous approach: peel off one group per divmod, each of which
+    # costs time proportional to the length of num, so O(n^2) overall.
+    parts = []
+    scale_index = 0
+    while num > 0:
+        num, chunk = divmod(num, 1000)
+        if chunk:
+            words = converter.chunk_words[chunk]
+            if scale_index:
+                words += ' ' + converter.scale_word(scale_index)
+            parts.append(words)
+        scale_index += 1
+    parts.reverse()
+    return ' '.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time convert() on random integers of 10**3 to 10**6 digits.")
+    parser.add_argument('--max-digits', type=int, default=1000000,
+                        help="largest size to try (default: 1,000,000)")
+    parser.add_argument('--divmod-max-digits', type=int, default=100000,
+                        help="largest size to also run the divmod loop on (default: 100,000)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    rng = random.Random(1)
+    
+    print(f"{'digits':>10} {'words (bytes)':>14} {'convert':>9} {'divmod':>9} {'parse':>9}")
+    digits = 1000
+    while digits <= args.max_digits:
+        # About `digits` decimal digits, made without str() or int() limits.
+        num = rng.getrandbits(int(digits * 3.3219280948873626)) | 1
+        converter.scale_word(digits // 3 + 1)  # name the scales outside the timing
+        
+        start = time.perf_counter()
+        words = converter.convert(num)
+        convert_time = time.perf_counter() - start
+        
+        divmod_time = ''
+        if digits <= args.divmod_max_digits:
+            start = time.perf_counter()
+            assert convert_by_divmod(converter, num) == words
+            divmod_time = f"{time.perf_counter() - start:.3f}s"
+        
+        start = time.perf_counter()
+        assert converter.parse(words) == num
+        parse_time = time.perf_counter() - start
+        
+        print(f"{digits:>10,} {len(words):>14,} {convert_time:>8.3f}s {divmod_time:>9} "
+              f"{parse_time:>8.3f}s")
+        digits *= 10
+
+
+if __name__ == '__main__':
+    main()
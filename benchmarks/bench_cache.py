@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# Benchmark: LRU-memoized convert on a Zipf-distributed stream of values #
+
+import argparse
+import os
+import random
+import sys
+import time
+from itertools import accumulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords
+
+
+def zipf_stream(count, universe, exponent, seed=0):
+    # count draws from `universe` random values, the k-th most common with
+    # probability proportional to 1 / k**exponent.
+    rng = random.Random(seed)
+    values = [rng.randrange(1, 10 ** 15) for _ in range(universe)]
+    weights = list(accumulate(1 / k ** exponent for k in range(1, universe + 1)))
+    return rng.choices(values, cum_weights=weights, k=count)
+
+
+def time_convert(convert, stream):
+    start = time.perf_counter()
+    for num in stream:
+        convert(num)
+    elapsed = time.perf_counter() - start
+    return len(stream) / elapsed if elapsed > 0 else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure NumberToWords.memoized against plain convert on Zipf input.")
+    parser.add_argument('--count', type=int, default=1000000, help="conversions (default: 1,000,000)")
+    parser.add_argument('--universe', type=int, default=1000000, help="distinct values (default: 1,000,000)")
+    parser.add_argument('--exponent', type=float, default=1.1, help="Zipf exponent (default: 1.1)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    stream = zipf_stream(args.count, args.universe, args.exponent)
+    
+    plain_rate = time_convert(converter.convert, stream)
+    print(f"{'plain convert':<22} {plain_rate:>12,.0f} n/s")
+    
+    for maxsize in (1024, 16384, 65536, 262144):
+        cached = converter.memoized(maxsize)
+        rate = time_convert(cached.convert, stream)
+        stats = cached.stats()
+        print(f"{'maxsize ' + format(maxsize, ','):<22} {rate:>12,.0f} n/s  "
+              f"{rate / plain_rate:5.2f}x  hit rate {stats['hit_rate']:6.1%}  "
+              f"evictions {stats['evictions']:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# Benchmark: write throughput and size of compressed, framed output #
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords, write_compressed, write_range
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare plain and gzip/bz2/xz framed output for 1..END.")
+    parser.add_argument('--end', type=int, default=1000000, help="last number (default: 1,000,000)")
+    parser.add_argument('--frame-size', type=int, default=100000,
+                        help="lines per frame (default: 100,000)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="compression threads (default: all CPUs)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    raw_size = converter.output_size(1, args.end)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'codec':<6} {'seconds':>8} {'n/s':>12} {'size':>14} {'ratio':>7}")
+        
+        path = os.path.join(tmp, 'numbers.txt')
+        start = time.perf_counter()
+        with open(path, 'wb') as out:
+            write_range(out, converter, 1, args.end + 1, args.frame_size)
+        elapsed = time.perf_counter() - start
+        print(f"{'none':<6} {elapsed:>8.2f} {args.end / elapsed:>12,.0f} {raw_size:>14,} {1:>7.1f}")
+        
+        for codec, extension in (('gzip', '.gz'), ('bz2', '.bz2'), ('xz', '.xz')):
+            path = os.path.join(tmp, 'numbers.txt' + extension)
+            start = time.perf_counter()
+            write_compressed(path, 1, args.end + 1, codec, args.frame_size, args.workers)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+            print(f"{codec:<6} {elapsed:>8.2f} {args.end / elapsed:>12,.0f} {size:>14,} "
+                  f"{raw_size / size:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
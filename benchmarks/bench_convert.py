@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Benchmark: table-driven NumberToWords.convert vs the original implementation #
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords
+
+
+class LegacyNumberToWords(NumberToWords):
+    # The original per-call implementation, kept here as the baseline.
+    
+    def convert(self, num: int) -> str:
+        if num == 0:
+            return 'zero'
+        
+        if num < 0:
+            return 'negative ' + self.convert(-num)
+        
+        result = ''
+        scale_index = 0
+        
+        while num > 0:
+            chunk = num % 1000
+            if chunk > 0:
+                chunk_words = self.convert_under_thousand(chunk)
+                if scale_index > 0:
+                    chunk_words += ' ' + self.scales[scale_index]
+                
+                if result:
+                    result = chunk_words + ' ' + result
+                else:
+                    result = chunk_words
+            
+            num //= 1000
+            scale_index += 1
+        
+        return result
+
+
+def time_range(converter, end_number):
+    # Convert 1..end_number and return numbers/sec.
+    convert = converter.convert
+    start = time.perf_counter()
+    for i in range(1, end_number + 1):
+        convert(i)
+    elapsed = time.perf_counter() - start
+    return end_number / elapsed if elapsed > 0 else 0
+
+
+def check_identical(legacy, table, samples):
+    # Make sure both implementations agree before timing anything.
+    for num in samples:
+        if legacy.convert(num) != table.convert(num):
+            raise AssertionError(f"Output differs for {num}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the table-driven converter with the original implementation.")
+    parser.add_argument('ranges', nargs='*', type=int, default=[1000000, 10000000],
+                        help="end numbers to benchmark (default: 1M and 10M)")
+    args = parser.parse_args()
+    
+    legacy = LegacyNumberToWords()
+    table = NumberToWords()
+    
+    samples = list(range(0, 100000)) + [10 ** k + d for k in range(3, 21) for d in (-1, 0, 1, 7)]
+    samples += [-5, -1000001, 999999999999999999999]
+    check_identical(legacy, table, samples)
+    
+    print(f"{'range':>14} {'legacy n/s':>14} {'table n/s':>14} {'speedup':>8}")
+    for end_number in args.ranges:
+        legacy_rate = time_range(legacy, end_number)
+        table_rate = time_range(table, end_number)
+        print(f"{end_number:>14,} {legacy_rate:>14,.0f} {table_rate:>14,.0f} "
+              f"{table_rate / legacy_rate:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Benchmark: NumPy convert_many vs calling convert once per element #
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare NumberToWords.convert_many with a per-element convert loop.")
+    parser.add_argument('--size', type=int, default=1000000, help="array length (default: 1,000,000)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    rng = np.random.default_rng(0)
+    
+    print(f"{'values below':>14} {'loop n/s':>14} {'vector n/s':>14} {'speedup':>8}")
+    for digits in (3, 6, 9, 12, 18):
+        values = rng.integers(0, 10 ** digits, size=args.size, dtype=np.int64)
+        as_list = values.tolist()
+        
+        start = time.perf_counter()
+        expected = [converter.convert(num) for num in as_list]
+        loop_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        result = converter.convert_many(values)
+        vector_time = time.perf_counter() - start
+        
+        if result.tolist() != expected:
+            raise AssertionError(f"convert_many differs from convert below 10^{digits}")
+        
+        print(f"{'10^' + str(digits):>14} {args.size / loop_time:>14,.0f} "
+              f"{args.size / vector_time:>14,.0f} {loop_time / vector_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Benchmark: plain versus pipelined writes on a slow volume #
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords, write_range, write_range_pipelined
+
+
+class ThrottledFile:
+    # Wraps a binary file so every write also takes size / bandwidth
+    # seconds, like a network volume. time.sleep releases the GIL just
+    # as a blocking write does.
+    
+    def __init__(self, f, bandwidth):
+        self.f = f
+        self.bandwidth = bandwidth
+    
+    def write(self, data):
+        time.sleep(len(data) / self.bandwidth)
+        return self.f.write(data)
+    
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare write_range with write_range_pipelined for 1..END.")
+    parser.add_argument('--end', type=int, default=3000000, help="last number (default: 3,000,000)")
+    parser.add_argument('--batch-size', type=int, default=100000,
+                        help="numbers per write (default: 100,000)")
+    parser.add_argument('--bandwidth', type=float, default=200,
+                        help="simulated volume speed in MB/s, 0 for the real disk (default: 200)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    size = converter.output_size(1, args.end)
+    bandwidth = args.bandwidth * 1024 * 1024
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'numbers.txt')
+        print(f"{'mode':<24} {'seconds':>8} {'n/s':>12} {'MB/s':>8}")
+        
+        for name, write in (('write_range', write_range),
+                            ('pipelined, 2 buffers', lambda *a: write_range_pipelined(*a, buffers=2)),
+                            ('pipelined, 4 buffers', lambda *a: write_range_pipelined(*a, buffers=4))):
+            with open(path, 'wb') as f:
+                out = ThrottledFile(f, bandwidth) if bandwidth else f
+                start = time.perf_counter()
+                write(out, converter, 1, args.end + 1, args.batch_size)
+                elapsed = time.perf_counter() - start
+            
+            print(f"{name:<24} {elapsed:>8.2f} {args.end / elapsed:>12,.0f} "
+                  f"{size / elapsed / (1024 * 1024):>8,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# Benchmark: load test of the conversion service (number_words_server.py) #
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from number_words_server import latency_summary
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    # http.client over a Unix socket.
+    
+    def __init__(self, path):
+        super().__init__('localhost')
+        self.path = path
+    
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX)
+        self.sock.connect(self.path)
+
+
+def start_server(workers, socket_path):
+    # Run `number_words.py serve` in a subprocess and return it with a
+    # factory for connections to it.
+    command = [sys.executable, os.path.join(ROOT, 'number_words.py'), 'serve',
+               '--workers', str(workers)]
+    command += ['--socket', socket_path] if socket_path else ['--port', '0']
+    server = subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
+    banner = server.stderr.readline()
+    if not banner.startswith('Serving on'):
+        server.kill()
+        raise RuntimeError(f"server did not start: {banner}{server.stderr.read()}")
+    
+    if socket_path:
+        return server, lambda: UnixHTTPConnection(socket_path)
+    host, port = banner.split()[2][len('http://'):].rsplit(':', 1)
+    return server, lambda: http.client.HTTPConnection(host, int(port))
+
+
+def request(connection, method, path, body=None):
+    connection.request(method, path, body, {'Content-Type': 'application/json'} if body else {})
+    response = connection.getresponse()
+    data = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"{method} {path}: {response.status} {data[:200]!r}")
+    return data
+
+
+def load(connect, clients, seconds, batch, magnitude):
+    # clients threads, each on its own keep-alive connection, post batches of
+    # random numbers below 10**magnitude for `seconds`. Returns the client-side
+    # latencies and the requests completed per second.
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    
+    def client(seed):
+        rng = random.Random(seed)
+        connection = connect()
+        mine = []
+        while time.perf_counter() < deadline:
+            body = json.dumps([rng.randrange(10 ** magnitude) for _ in range(batch)])
+            before = time.perf_counter()
+            request(connection, 'POST', '/convert', body)
+            mine.append(time.perf_counter() - before)
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+    
+    threads = [threading.Thread(target=client, args=(seed,)) for seed in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, len(latencies) / (time.perf_counter() - started)
+
+
+def stream_range(connect, end):
+    # GET /range for 1..end; returns (time to first byte, total time, bytes).
+    connection = connect()
+    before = time.perf_counter()
+    connection.request('GET', f'/range?start=1&end={end}')
+    response = connection.getresponse()
+    size = len(response.read(65536))
+    first_byte = time.perf_counter() - before
+    while True:
+        data = response.read(1 << 20)
+        if not data:
+            break
+        size += len(data)
+    elapsed = time.perf_counter() - before
+    connection.close()
+    return first_byte, elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test `number_words.py serve`: latency percentiles and throughput "
+                    "for /convert batches, and /range streaming speed.")
+    parser.add_argument('--workers', type=int, default=1, help="server worker processes (default: 1)")
+    parser.add_argument('--clients', type=int, default=4, help="concurrent clients (default: 4)")
+    parser.add_argument('--seconds', type=float, default=3.0, help="seconds per batch size (default: 3)")
+    parser.add_argument('--batches', default='1,100,10000',
+                        help="comma-separated batch sizes (default: 1,100,10000)")
+    parser.add_argument('--digits', type=int, default=12,
+                        help="numbers are drawn below 10**DIGITS (default: 12)")
+    parser.add_argument('--range-end', type=int, default=2000000,
+                        help="last number for the /range test (default: 2,000,000)")
+    parser.add_argument('--socket', action='store_true', help="use a Unix socket instead of TCP")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'words.sock') if args.socket else None
+        server, connect = start_server(args.workers, socket_path)
+        try:
+            print(f"{'batch':>7} {'req/s':>9} {'numbers/s':>12} {'p50 ms':>8} {'p90 ms':>8} "
+                  f"{'p99 ms':>8} {'max ms':>8}")
+            for batch in (int(size) for size in args.batches.split(',')):
+                latencies, rate = load(connect, args.clients, args.seconds, batch, args.digits)
+                summary = latency_summary(latencies)
+                print(f"{batch:>7,} {rate:>9,.0f} {rate * batch:>12,.0f} {summary['p50']:>8.2f} "
+                      f"{summary['p90']:>8.2f} {summary['p99']:>8.2f} {summary['max']:>8.2f}")
+            
+            first_byte, elapsed, size = stream_range(connect, args.range_end)
+            print(f"\n/range 1..{args.range_end:,}: {size / elapsed / (1024 * 1024):,.1f} MB/s, "
+                  f"{args.range_end / elapsed:,.0f} numbers/s, first byte after "
+                  f"{first_byte * 1000:.1f} ms")
+            
+            stats = json.loads(request(connect(), 'GET', '/stats'))
+            convert = stats['routes']['/convert']['latency_ms']
+            print(f"\nServer side: {stats['requests']:,} requests, "
+                  f"{stats['numbers_per_second']:,.0f} numbers/s overall, /convert p50 "
+                  f"{convert['p50']:.2f} ms, p99 {convert['p99']:.2f} ms")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
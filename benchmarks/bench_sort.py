@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Benchmark: sorted output with an external merge sort #
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords, write_sorted, parse_size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time write_sorted for 1..END under several memory budgets.")
+    parser.add_argument('--end', type=int, default=5000000, help="last number (default: 5,000,000)")
+    parser.add_argument('--memory', type=parse_size, nargs='+', default=[16 << 20, 64 << 20, 256 << 20],
+                        help="budgets to try, e.g. 64M 1G (default: 16M 64M 256M)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processes sorting runs (default: 1; peak memory is then "
+                             "only measured for this process)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    
+    # The in-memory sort with and without the presorted blocks.
+    lines = [line for block in converter.iter_byte_blocks(1, args.end + 1)
+             for line in block.split(b'\n')[:-1]]
+    start = time.perf_counter()
+    lines.sort()
+    plain = time.perf_counter() - start
+    
+    lines = [line for block in converter.iter_sorted_blocks(1, args.end + 1) for line in block]
+    start = time.perf_counter()
+    lines.sort()
+    presorted = time.perf_counter() - start
+    del lines
+    print(f"list.sort of {args.end:,} lines: {plain:.2f}s plain, "
+          f"{presorted:.2f}s from presorted blocks")
+    
+    print(f"{'budget':>10} {'seconds':>8} {'n/s':>12} {'peak':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sorted.txt')
+        for memory in args.memory:
+            tracemalloc.start()
+            start = time.perf_counter()
+            with open(path, 'wb') as out:
+                write_sorted(out, 1, args.end + 1, memory, args.workers, tmp)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            
+            print(f"{memory / (1 << 20):>9,.0f}M {elapsed:>8.2f} {args.end / elapsed:>12,.0f} "
+                  f"{peak / (1 << 20):>9,.1f}M")
+
+
+if __name__ == '__main__':
+    main()
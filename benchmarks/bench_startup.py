@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# Benchmark: start-up cost of the headless command line #
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, 'number_words.py')
+
+
+def time_command(command, runs):
+    # Average wall time of running command, in milliseconds.
+    start = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure how long the number_words.py command line takes to start.")
+    parser.add_argument('--runs', type=int, default=50, help="runs per command (default: 50)")
+    args = parser.parse_args()
+    
+    # The CLI must never pull in tkinter.
+    check = subprocess.run(
+        [sys.executable, '-c',
+         "import sys; sys.path.insert(0, sys.argv[1]); import number_words; "
+         "print('tkinter' in sys.modules)", ROOT],
+        capture_output=True, text=True, check=True)
+    if check.stdout.strip() != 'False':
+        raise AssertionError("number_words imports tkinter")
+    
+    baseline = time_command([sys.executable, '-c', 'pass'], args.runs)
+    convert = time_command([sys.executable, CLI, 'convert', '123456789'], args.runs)
+    generate = time_command([sys.executable, CLI, 'generate', '1', '1000'], args.runs)
+    
+    print(f"{'python -c pass':<32} {baseline:8.1f} ms")
+    print(f"{'number_words.py convert':<32} {convert:8.1f} ms  (+{convert - baseline:.1f})")
+    print(f"{'number_words.py generate 1 1000':<32} {generate:8.1f} ms  (+{generate - baseline:.1f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Benchmark: converting sparse, strided and file-driven number sets #
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords, read_number_batches, write_numbers
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-number convert with encode_many, iter_stepped_batches "
+                    "and the file-driven stream path.")
+    parser.add_argument('--count', type=int, default=1000000,
+                        help="numbers per input set (default: 1,000,000)")
+    parser.add_argument('--step', type=int, default=7, help="stride for the stepped set (default: 7)")
+    args = parser.parse_args()
+    
+    converter = NumberToWords()
+    convert = converter.convert
+    rng = random.Random(1)
+    count = args.count
+    sets = {
+        f'step {args.step}': range(10 ** 9, 10 ** 9 + count * args.step, args.step),
+        'sorted sample < 10**12': sorted(rng.sample(range(10 ** 9, 10 ** 9 + count * 20), count)),
+        'random < 10**12': [rng.randrange(10 ** 12) for _ in range(count)],
+        'random < 10**18': [rng.randrange(10 ** 18) for _ in range(count)],
+    }
+    
+    print(f"{'input':<24} {'convert n/s':>13} {'encode_many n/s':>16} {'speed-up':>9}")
+    for name, values in sets.items():
+        plain, expected = timed(lambda: ''.join(convert(n) + '\n' for n in values).encode())
+        fast, data = timed(lambda: converter.encode_many(values))
+        assert data == expected, name
+        print(f"{name:<24} {count / plain:>13,.0f} {count / fast:>16,.0f} {plain / fast:>8.1f}x")
+    
+    stepped = sets[f'step {args.step}']
+    elapsed, _ = timed(lambda: sum(len(data) for _, data in converter.iter_stepped_batches(
+        stepped.start, stepped.stop, stepped.step, 100000)))
+    print(f"{'step ' + str(args.step) + ' (stepped blocks)':<24} {'':>13} {count / elapsed:>16,.0f}")
+    
+    # End to end: a file of integers in, words out, in bounded memory.
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'numbers.txt')
+        with open(path, 'w') as f:
+            f.write('\n'.join(map(str, sets['random < 10**12'])) + '\n')
+        size = os.path.getsize(path)
+        
+        with open(path, 'rb') as source, open(os.devnull, 'wb') as out:
+            elapsed, written = timed(lambda: write_numbers(out, converter,
+                                                           read_number_batches(source)))
+        print(f"\nstream {size / (1024 * 1024):,.1f} MB of random integers: "
+              f"{written / elapsed:,.0f} numbers/s, {size / elapsed / (1024 * 1024):,.1f} MB/s in")
+
+
+if __name__ == '__main__':
+    main()
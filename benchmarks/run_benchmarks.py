@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# Benchmark suite for the conversion and generation hot paths #
+#
+#   python benchmarks/run_benchmarks.py                     # table of results
+#   python benchmarks/run_benchmarks.py --json results.json # machine-readable copy
+#   python benchmarks/run_benchmarks.py --compare results.json   # flag regressions
+#   python benchmarks/run_benchmarks.py --profile prof/ --tracemalloc
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_words import NumberToWords, write_range
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    # Register a benchmark. The decorated function takes (converter, scale)
+    # and returns (operations, run) where run() does the timed work once.
+    def register(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+
+@benchmark('convert_under_thousand 0-999')
+def bench_under_thousand(converter, scale):
+    numbers = list(range(1000)) * (100 * scale)
+    convert_under_thousand = converter.convert_under_thousand
+    
+    def run():
+        for num in numbers:
+            convert_under_thousand(num)
+    return len(numbers), run
+
+
+def make_convert_bench(digits):
+    @benchmark(f'convert {digits}-digit numbers')
+    def bench_convert(converter, scale):
+        rng = random.Random(digits)
+        numbers = [rng.randrange(10 ** (digits - 1), 10 ** digits) for _ in range(20000 * scale)]
+        convert = converter.convert
+        
+        def run():
+            for num in numbers:
+                convert(num)
+        return len(numbers), run
+
+
+for _digits in (1, 3, 4, 6, 9, 12, 15, 18, 21):
+    make_convert_bench(_digits)
+
+
+@benchmark('iter_range 1..1M (str lines)')
+def bench_iter_range(converter, scale):
+    stop = 1000000 * scale + 1
+    
+    def run():
+        for _ in converter.iter_range(1, stop):
+            pass
+    return stop - 1, run
+
+
+@benchmark('iter_byte_blocks 1..1M')
+def bench_byte_blocks(converter, scale):
+    stop = 1000000 * scale + 1
+    
+    def run():
+        for _ in converter.iter_byte_blocks(1, stop):
+            pass
+    return stop - 1, run
+
+
+@benchmark('iter_byte_blocks 10^12..+1M')
+def bench_byte_blocks_high(converter, scale):
+    start = 10 ** 12
+    stop = start + 1000000 * scale
+    
+    def run():
+        for _ in converter.iter_byte_blocks(start, stop):
+            pass
+    return stop - start, run
+
+
+def make_write_bench(batch_size):
+    @benchmark(f'write 1..1M, batch {batch_size:,}')
+    def bench_write(converter, scale):
+        stop = 1000000 * scale + 1
+        path = os.path.join(tempfile.gettempdir(), f'number_words_bench_{os.getpid()}.txt')
+        
+        def run():
+            with open(path, 'wb') as out:
+                write_range(out, converter, 1, stop, batch_size)
+            os.remove(path)
+        return stop - 1, run
+
+
+for _batch_size in (1000, 10000, 100000, 1000000):
+    make_write_bench(_batch_size)
+
+
+def run_benchmark(name, setup, converter, args):
+    # Time one benchmark (best of args.repeat) and optionally profile it.
+    operations, run = setup(converter, args.scale)
+    
+    times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    
+    result = {
+        'name': name,
+        'operations': operations,
+        'best_seconds': best,
+        'mean_seconds': sum(times) / len(times),
+        'ops_per_sec': operations / best if best > 0 else 0,
+    }
+    
+    if args.tracemalloc:
+        tracemalloc.start()
+        run()
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(run)
+        safe_name = ''.join(c if c.isalnum() else '_' for c in name).strip('_')
+        path = os.path.join(args.profile, safe_name + '.prof')
+        profiler.dump_stats(path)
+        result['profile'] = path
+    
+    return result
+
+
+def compare(results, baseline_path, threshold):
+    # Print the change against a saved run; return the names that regressed.
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {r['name']: r for r in json.load(f)['results']}
+    
+    regressions = []
+    print(f"\nCompared with {baseline_path}:")
+    for result in results:
+        before = baseline.get(result['name'])
+        if not before or not before['ops_per_sec']:
+            continue
+        change = result['ops_per_sec'] / before['ops_per_sec'] - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  REGRESSION'
+            regressions.append(result['name'])
+        print(f"  {result['name']:<34} {change:+7.1%}{flag}")
+    
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the conversion and generation hot paths.")
+    parser.add_argument('--filter', default='', help="only run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark, best is kept (default: 3)")
+    parser.add_argument('--scale', type=int, default=1, help="multiply the workload size (default: 1)")
+    parser.add_argument('--json', metavar='FILE', help="also write the results as JSON")
+    parser.add_argument('--compare', metavar='FILE', help="compare with a previous --json run")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="slowdown reported as a regression (default: 0.10)")
+    parser.add_argument('--profile', metavar='DIR', help="write a cProfile .prof file per benchmark")
+    parser.add_argument('--tracemalloc', action='store_true', help="record peak memory per benchmark")
+    args = parser.parse_args()
+    
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+    
+    converter = NumberToWords()
+    results = []
+    
+    print(f"{'benchmark':<34} {'ops/sec':>14} {'best':>9}" + (f" {'peak':>10}" if args.tracemalloc else ''))
+    for name, setup in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        result = run_benchmark(name, setup, converter, args)
+        results.append(result)
+        
+        line = f"{name:<34} {result['ops_per_sec']:>14,.0f} {result['best_seconds']:>8.3f}s"
+        if args.tracemalloc:
+            line += f" {result['peak_bytes'] / 1024:>8,.0f}KB"
+        print(line)
+    
+    if args.profile:
+        for result in results:
+            print(f"\n== {result['name']} ({result['profile']})")
+            pstats.Stats(result['profile']).sort_stats('cumulative').print_stats(5)
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'scale': args.scale,
+                'results': results,
+            }, f, indent=2)
+    
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2607 @@
+#!/usr/bin/env python3
+# Number to Words engine and command-line generator #
+#
+# Everything here works without a display: the Tkinter GUI in
+# Number_to_Words.py builds on it, and it can be run directly:
+#
+#   python number_words.py convert 12345
+#   python number_words.py generate 1 1000000 -o numbers.txt
+#   python number_words.py generate 1 1000000 | grep seven
+#   seq 7 7 700000 | python number_words.py stream > sevens.txt
+#   python number_words.py serve --port 8080
+
+import os
+import sys
+import time
+import mmap
+
+class NumberToWords:
+    # Convert numbers to their written word form.
+    
+    def __init__(self):
+        self.ones = ['', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+        self.teens = ['ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 
+                     'sixteen', 'seventeen', 'eighteen', 'nineteen']
+        self.tens = ['', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety']
+        self.scales = ['', 'thousand', 'million', 'billion', 'trillion', 'quadrillion','quintillion']
+        
+        # Precompute the words for every chunk 0-999 and, for each scale, the
+        # chunk words with the scale suffix attached ('' for chunk 0).
+        self.chunk_words = [self.convert_under_thousand(n) for n in range(1000)]
+        self.scaled_chunk_words = [self.chunk_words]
+        for scale in self.scales[1:]:
+            self.scaled_chunk_words.append(
+                [''] + [words + ' ' + scale for words in self.chunk_words[1:]])
+        
+        # Pre-encoded chunk words for the bytes block writer.
+        self.chunk_bytes = [words.encode('utf-8') for words in self.chunk_words]
+        
+        # chunk_length_sums[h] is the total length of the words for chunks 0..h-1,
+        # used to size ranges without generating them.
+        self.chunk_length_sums = [0]
+        for words in self.chunk_words:
+            self.chunk_length_sums.append(self.chunk_length_sums[-1] + len(words))
+        
+        # Numbers below this are converted with table lookups alone.
+        self.table_limit = 1000 ** len(self.scaled_chunk_words)
+        
+        # Token trie for parse(), built on first use.
+        self._parse_trie = None
+        
+        # Word and letter count tables for range_stats(), built on first use.
+        self._feature_tables = None
+        
+        # Chunks 1-999 in the order their words sort, built on first use.
+        self._sorted_chunks = None
+        
+        # Per-scale NumPy word tables for convert_many(), built on first use.
+        self._array_tables = None
+    
+    def convert_under_thousand(self, num: int) -> str:
+        # Convert numbers under 1000 to words.
+        if num == 0:
+            return ''
+        
+        result = ''
+        
+        # Handle hundreds
+        if num >= 100:
+            result += self.ones[num // 100] + ' hundred'
+            num %= 100
+            if num > 0:
+                result += ' '
+        
+        # Handle tens and ones
+        if num >= 20:
+            result += self.tens[num // 10]
+            if num % 10 > 0:
+                result += ' ' + self.ones[num % 10]
+        elif num >= 10:
+            result += self.teens[num - 10]
+        elif num > 0:
+            result += self.ones[num]
+        
+        return result
+    
+    def convert(self, num: int) -> str:
+        # Convert any number to words using the precomputed chunk tables.
+        # Numbers past the tables (10**21 and up) go through iter_words.
+        if num < 1000:
+            if num > 0:
+                return self.chunk_words[num]
+            if num == 0:
+                return 'zero'
+            return 'negative ' + self.convert(-num)
+        
+        tables = self.scaled_chunk_words
+        if num >= self.table_limit:
+            return ' '.join(self.iter_words(num))
+        
+        parts = []
+        scale_index = 0
+        
+        while num > 0:
+            num, chunk = divmod(num, 1000)
+            if chunk:
+                parts.append(tables[scale_index][chunk])
+            scale_index += 1
+        
+        parts.reverse()
+        return ' '.join(parts)
+    
+    def scale_word(self, index: int) -> str:
+        # Scale word for 1000**index. self.scales is extended copy-on-write:
+        # the longer list is built aside and published in one assignment, so
+        # threads sharing a converter only ever see complete, correct lists.
+        scales = self.scales
+        if index >= len(scales):
+            scales = scales + [scale_name(i) for i in range(len(scales), index + 1)]
+            self.scales = scales
+        return scales[index]
+    
+    def iter_words(self, num: int):
+        # Yield the words for num one group at a time, most significant
+        # first, so ' '.join(iter_words(num)) == convert(num). Integers of
+        # any size work: the digits come from int_to_digits in one
+        # subquadratic pass instead of a divmod per group, and the words can
+        # be written out as they are produced.
+        if num < 0:
+            yield 'negative'
+            num = -num
+        if num < 1000:
+            yield self.convert(num)
+            return
+        
+        digits = int_to_digits(num)
+        tables = self.scaled_chunk_words
+        chunk_words = self.chunk_words
+        scale_index = (len(digits) - 1) // 3
+        position = 0
+        width = len(digits) - scale_index * 3
+        
+        while scale_index >= 0:
+            chunk = int(digits[position:position + width])
+            if chunk:
+                if scale_index < len(tables):
+                    yield tables[scale_index][chunk]
+                else:
+                    yield chunk_words[chunk] + ' ' + self.scale_word(scale_index)
+            position += width
+            width = 3
+            scale_index -= 1
+    
+    def build_parse_trie(self):
+        # Token trie over the words for 1-999: each node maps the next word
+        # to a child node, and a complete chunk stores its value under None.
+        # Scale words covered by the chunk tables map to their multipliers in
+        # a separate table (larger ones are decoded with scale_index), and
+        # whole chunk phrases map straight to their values for parse_lines.
+        root = {}
+        for value, words in enumerate(self.chunk_words[1:], 1):
+            node = root
+            for token in words.split(' '):
+                node = node.setdefault(token, {})
+            node[None] = value
+        
+        scales = {scale: (index, 1000 ** index)
+                  for index, scale in enumerate(self.scales[:len(self.scaled_chunk_words)]) if scale}
+        chunks = {words: value for value, words in enumerate(self.chunk_words) if value}
+        self._parse_trie = (root, scales, chunks)
+        return self._parse_trie
+    
+    def parse(self, text: str) -> int:
+        # Convert words back to a number in a single pass over the tokens.
+        # Only the exact form convert() produces is accepted, so
+        # parse(convert(n)) == n and anything else raises ValueError.
+        root, scales, _ = self._parse_trie or self.build_parse_trie()
+        
+        tokens = text.split(' ')
+        sign = 1
+        if tokens[0] == 'negative':
+            sign = -1
+            del tokens[0]
+        elif text == 'zero':
+            return 0
+        
+        total = 0
+        big = []  # (scale index, chunk) for scales past the tables
+        last_scale = None
+        node = root
+        
+        for token in tokens:
+            child = node.get(token)
+            if child is not None:
+                node = child
+                continue
+            
+            # Anything that does not continue the chunk must be a smaller
+            # scale word closing a complete chunk.
+            scale = scales.get(token)
+            if scale is None and None in node:
+                index = scale_index(token)
+                if index is not None:
+                    scale = (index, None)
+            if (scale is None or None not in node
+                    or (last_scale is not None and scale[0] >= last_scale)):
+                raise ValueError(f"Not a number in words: {text!r}")
+            
+            if scale[1] is None:
+                big.append((scale[0], node[None]))
+            else:
+                total += node[None] * scale[1]
+            last_scale = scale[0]
+            node = root
+        
+        if node is not root:
+            if None not in node:
+                raise ValueError(f"Not a number in words: {text!r}")
+            total += node[None]
+        elif not total and not big:
+            raise ValueError(f"Not a number in words: {text!r}")
+        
+        if big:
+            # Lay the large groups out as digits rather than summing powers
+            # of 1000 with thousands of digits each.
+            first = len(self.scaled_chunk_words)
+            groups = ['000'] * (big[0][0] - first + 1)
+            for index, value in big:
+                groups[big[0][0] - index] = f'{value:03d}'
+            total += int_from_digits(''.join(groups)) * self.table_limit
+        
+        return sign * total
+    
+    def parse_lines(self, lines):
+        # Parse an iterable of lines (trailing newlines allowed), yielding the
+        # numbers. Errors say which line failed, counting from 1.
+        # Consecutive lines usually share everything above their lowest group,
+        # so the words for that prefix are remembered: a line that starts with
+        # it only needs its last chunk looked up. Other lines use parse().
+        parse = self.parse
+        chunks = (self._parse_trie or self.build_parse_trie())[2]
+        prefix = None
+        base = 0
+        
+        for line_number, line in enumerate(lines, 1):
+            text = line.rstrip('\n')
+            
+            if prefix is not None and text.startswith(prefix):
+                value = chunks.get(text[len(prefix):])
+                if value is not None:
+                    yield base + value
+                    continue
+            
+            try:
+                num = parse(text)
+            except ValueError as e:
+                raise ValueError(f"Line {line_number:,}: {e}") from None
+            
+            if num >= 1000:
+                base = num - num % 1000
+                prefix = self.convert(base) + ' '
+            else:
+                prefix = None
+            
+            yield num
+    
+    def bytes_below(self, num: int) -> int:
+        # Total bytes of the lines for 1..num-1 (words plus newline each).
+        # A line is the sum over its non-zero groups of the scaled chunk words
+        # plus one separator (a space, or the final newline), so each group
+        # position can be counted on its own: how many numbers below num have
+        # each chunk value there. At position k, with group size g, chunk c
+        # and r = num % g, that is
+        #   (num - num % (1000 * g)) / 1000 * full(k) + [c > 0] * (g * head(c) + r * tail(c))
+        # and since r is a sum of lower chunks times their group sizes, the
+        # total regroups into num * sum(full) / 1000 plus two numbers whose
+        # base-1000 digits are small per-position sums (see group_chunks).
+        # Linear in the groups apart from one conversion; no divmod of num.
+        if num <= 1:
+            return 0
+        
+        sums = self.chunk_length_sums
+        chunks = group_chunks(num)
+        self.scale_word(len(chunks) - 1)
+        scales = self.scales
+        fulls = []
+        heads = []
+        tails = []
+        
+        for scale_index, chunk in enumerate(chunks):
+            extra = len(scales[scale_index]) + 1 if scale_index else 0
+            fulls.append(sums[1000] + 999 * (extra + 1))
+            heads.append(sums[chunk] + (chunk - 1) * (extra + 1) if chunk else 0)
+            tails.append(len(self.chunk_words[chunk]) + extra + 1 if chunk else 0)
+        
+        # Suffix sums from the top: fulls over positions >= k, tails over > k.
+        cut = [0] * len(chunks)
+        kept = [0] * len(chunks)
+        full_after = tail_after = 0
+        for k in range(len(chunks) - 1, -1, -1):
+            full_after += fulls[k]
+            cut[k] = chunks[k] * full_after
+            kept[k] = heads[k] + chunks[k] * tail_after
+            tail_after += tails[k]
+        
+        return (num * full_after - int_from_groups(cut)) // 1000 + int_from_groups(kept)
+    
+    def output_size(self, start: int, end: int) -> int:
+        # Exact byte count of the output for start..end inclusive, one
+        # UTF-8 line per number with '\n' line endings.
+        if start > end:
+            return 0
+        
+        size = 0
+        if start < 0:
+            # 'negative ' plus the words for the absolute value
+            low, high = max(1, -end), -start
+            size += (high - low + 1) * 9 + self.bytes_below(high + 1) - self.bytes_below(low)
+        if start <= 0 <= end:
+            size += 5  # 'zero\n'
+        if end > 0:
+            size += self.bytes_below(end + 1) - self.bytes_below(max(start, 1))
+        
+        return size
+    
+    def line_offset(self, num: int, start: int = 1) -> int:
+        # Byte offset of the line for num in output that begins at start.
+        if num < start:
+            raise ValueError(f"{num} comes before the first number {start}")
+        return self.output_size(start, num - 1)
+    
+    def feature_tables(self):
+        # Per-chunk counts of every word and letter, for range_stats: returns
+        # (vocabulary, vectors, prefix) where vectors[c] holds the counts for
+        # the words of chunk c (vocabulary first, then a-z) and prefix[c] is
+        # the sum of vectors[0..c-1]. Built on first use.
+        if self._feature_tables is None:
+            vocabulary = sorted({word for words in self.chunk_words for word in words.split()})
+            index = {word: i for i, word in enumerate(vocabulary)}
+            letters = len(vocabulary) - ord('a')
+            width = len(vocabulary) + 26
+            
+            vectors = []
+            for words in self.chunk_words:
+                vector = [0] * width
+                for word in words.split():
+                    vector[index[word]] += 1
+                    for letter in word:
+                        vector[letters + ord(letter)] += 1
+                vectors.append(vector)
+            
+            prefix = [[0] * width]
+            for vector in vectors:
+                prefix.append([a + b for a, b in zip(prefix[-1], vector)])
+            
+            self._feature_tables = (vocabulary, vectors, prefix)
+        return self._feature_tables
+    
+    def features_below(self, num: int):
+        # Word and letter counts over the lines for 1..num-1, counted per
+        # group position like bytes_below. Returns (totals, scale_counts):
+        # totals is laid out as in feature_tables and scale_counts maps a
+        # scale index to how many times its scale word appears.
+        # The totals regroup as in bytes_below, so each one is a single
+        # multiplication plus a number built from base-1000 digits.
+        _, vectors, prefix = self.feature_tables()
+        if num <= 1:
+            return [0] * len(prefix[0]), {}
+        
+        chunks = group_chunks(num)
+        count = len(chunks)
+        # Sum over positions of the numbers below num with a full cycle there.
+        full_total = (count * num - int_from_groups([chunk * (count - k)
+                                                     for k, chunk in enumerate(chunks)])) // 1000
+        
+        totals = []
+        for i, whole in enumerate(prefix[1000]):
+            groups = [0] * count
+            after = 0
+            for k in range(count - 1, -1, -1):
+                chunk = chunks[k]
+                groups[k] = prefix[chunk][i] + chunk * after
+                after += vectors[chunk][i]
+            totals.append(full_total * whole + int_from_groups(groups))
+        
+        # The scale word follows every non-zero chunk at a position. One count
+        # per scale, so these are built up position by position.
+        scale_counts = {}
+        group_size = 1
+        partial = 0
+        for scale_index, chunk in enumerate(chunks):
+            if group_size >= num:
+                break
+            below = partial + chunk * group_size
+            if scale_index:
+                scale_counts[scale_index] = ((num - below) // 1000 * 999
+                                             + group_size * max(chunk - 1, 0)
+                                             + (partial if chunk else 0))
+            partial = below
+            group_size *= 1000
+        
+        return totals, scale_counts
+    
+    def extreme_line(self, low: int, high: int, longest: bool = True):
+        # (length, number) for the longest (or shortest) line among
+        # low..high, 1 <= low <= high, without visiting the numbers. A line is
+        # a sum of independent costs per non-zero group, so this is a digit
+        # DP over the groups from the top: a group may take any chunk once
+        # the number is strictly inside the bounds, and only the paths that
+        # still follow low's or high's own groups need tracking (4 states).
+        pick = max if longest else min
+        lengths = [len(words) for words in self.chunk_words]
+        digits = int_to_digits(high)
+        count = (len(digits) + 2) // 3
+        digits = digits.zfill(count * 3)
+        high_groups = [int(digits[i:i + 3]) for i in range(0, count * 3, 3)]
+        digits = int_to_digits(low).zfill(count * 3)
+        low_groups = [int(digits[i:i + 3]) for i in range(0, count * 3, 3)]
+        
+        def best_chunk(first, last, scale_cost):
+            # (cost, chunk) of the best chunk in first..last at one position.
+            options = []
+            if first == 0:
+                options.append((0, 0))
+                first = 1
+            if first <= last:
+                chunk = pick(range(first, last + 1), key=lengths.__getitem__)
+                options.append((lengths[chunk] + scale_cost, chunk))
+            return pick(options)
+        
+        # best[state] = (cost of the groups below, chosen chunks from the
+        # bottom up) for states (on low's groups, on high's groups).
+        states = [(False, False), (False, True), (True, False), (True, True)]
+        best = {state: (0, None) for state in states}
+        
+        for position in range(count - 1, -1, -1):
+            scale_index = count - 1 - position
+            # Every non-zero group costs its words plus a separator.
+            scale_cost = 1 + (len(self.scale_word(scale_index)) + 1 if scale_index else 0)
+            current = {}
+            
+            for on_low, on_high in states:
+                first = low_groups[position] if on_low else 0
+                last = high_groups[position] if on_high else 999
+                if first > last:
+                    continue
+                
+                options = []
+                for chunk, state in ((first, (on_low, on_high and first == last)),
+                                     (last, (on_low and first == last, on_high))):
+                    if state in best:
+                        cost = lengths[chunk] + scale_cost if chunk else 0
+                        options.append((cost + best[state][0], (chunk, best[state][1])))
+                if last - first >= 2:
+                    cost, chunk = best_chunk(first + 1, last - 1, scale_cost)
+                    options.append((cost + best[(False, False)][0],
+                                    (chunk, best[(False, False)][1])))
+                
+                if options:  # otherwise low's remaining groups exceed high's
+                    current[(on_low, on_high)] = pick(options, key=lambda option: option[0])
+            
+            best = current
+        
+        cost, chosen = best[(True, True)]
+        groups = []
+        while chosen is not None:
+            chunk, chosen = chosen
+            groups.append(f'{chunk:03d}')
+        
+        # The last group's separator is the newline, which is not counted.
+        return cost - 1, int_from_digits(''.join(groups))
+    
+    def range_stats(self, start: int, end: int):
+        # Aggregates over the lines for start..end inclusive, computed per
+        # group position from the digits rather than by generating them:
+        # line count, bytes, total words, per-word counts (most common
+        # first), letter counts and the longest and shortest line as
+        # (length, number).
+        if start > end:
+            raise ValueError(f"Empty range {start}..{end}")
+        
+        vocabulary, _, _ = self.feature_tables()
+        totals = [0] * (len(vocabulary) + 26)
+        scale_counts = {}
+        word_counts = {}
+        extremes = []
+        
+        def add_positive(low, high):
+            upper, upper_scales = self.features_below(high + 1)
+            lower, lower_scales = self.features_below(low)
+            for i in range(len(totals)):
+                totals[i] += upper[i] - lower[i]
+            for index, count in upper_scales.items():
+                scale_counts[index] = (scale_counts.get(index, 0)
+                                       + count - lower_scales.get(index, 0))
+        
+        if start < 0:
+            low, high = max(1, -end), -start
+            add_positive(low, high)
+            word_counts['negative'] = high - low + 1
+            for longest in (True, False):
+                length, num = self.extreme_line(low, high, longest)
+                extremes.append((length + 9, -num))
+        if start <= 0 <= end:
+            word_counts['zero'] = 1
+            extremes.append((4, 0))
+        if end > 0:
+            low = max(start, 1)
+            for longest in (True, False):
+                extremes.append(self.extreme_line(low, end, longest))
+            add_positive(low, end)
+        
+        for word, count in zip(vocabulary, totals):
+            if count:
+                word_counts[word] = word_counts.get(word, 0) + count
+        for index, count in scale_counts.items():
+            if count:
+                word_counts[self.scale_word(index)] = count
+        
+        letter_counts = dict(zip('abcdefghijklmnopqrstuvwxyz', totals[len(vocabulary):]))
+        for word in ('negative', 'zero'):
+            for letter in word:
+                letter_counts[letter] += word_counts.get(word, 0)
+        for index, count in scale_counts.items():
+            for letter in self.scale_word(index):
+                letter_counts[letter] += count
+        
+        words = sum(word_counts.values())
+        return {
+            'start': start,
+            'end': end,
+            'lines': end - start + 1,
+            'bytes': self.output_size(start, end),
+            'words': words,
+            'word_counts': dict(sorted(word_counts.items(), key=lambda item: (-item[1], item[0]))),
+            'letter_counts': {letter: count for letter, count in letter_counts.items() if count},
+            'longest': max(extremes, key=lambda extreme: extreme[0]),
+            'shortest': min(extremes, key=lambda extreme: extreme[0]),
+        }
+    
+    def iter_sorted_blocks(self, start: int, stop: int):
+        # Yield the lines for range(start, stop) as lists of bytes without
+        # newlines, one list per iter_byte_blocks block, each already in
+        # sorted order. Lines in a block share their prefix and differ only
+        # in the last group's words, which always sort the same way, so that
+        # order is worked out once.
+        if start < 1:
+            head = sorted(self.convert(n).encode('utf-8') for n in range(start, min(stop, 1)))
+            if head:
+                yield head
+            start = 1
+        
+        if self._sorted_chunks is None:
+            self._sorted_chunks = sorted(range(1, 1000), key=self.chunk_words.__getitem__)
+        order = self._sorted_chunks
+        chunk_bytes = self.chunk_bytes
+        high, low = divmod(start, 1000)
+        
+        while start < stop:
+            last = min(1000, stop - high * 1000)
+            chunks = order if low <= 1 and last == 1000 else [c for c in order if low <= c < last]
+            
+            if high:
+                prefix = self.convert(high * 1000).encode('utf-8')
+                lead = prefix + b' '
+                block = [prefix] if low == 0 else []
+                block += [lead + chunk_bytes[c] for c in chunks]
+            else:
+                block = [chunk_bytes[c] for c in chunks]
+            
+            yield block
+            
+            high += 1
+            low = 0
+            start = high * 1000
+    
+    def memoized(self, maxsize: int = 65536):
+        # Return an LRU-caching front end for convert (see MemoizedConverter).
+        return MemoizedConverter(self, maxsize)
+    
+    def last_number_within(self, size: int, start: int = 1) -> int:
+        # Largest n such that the lines for start..n fit in size bytes
+        # (start - 1 if not even the first line fits). Binary search on
+        # output_size; no line is shorter than 4 bytes, which bounds it.
+        lo, hi = start - 1, start + size // 4
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.output_size(start, mid) <= size:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+    
+    def iter_blocks(self, start: int, stop: int):
+        # Yield the words for range(start, stop) as lists, one list per run of
+        # numbers that share their higher-order groups (at most 1000 numbers).
+        # The prefix for those groups is only rebuilt when the lowest group
+        # rolls over; every line in between is that prefix plus a cached chunk.
+        if start < 1:
+            # Zero and negatives are rare enough to go through convert().
+            head = [self.convert(n) for n in range(start, min(stop, 1))]
+            if head:
+                yield head
+            start = 1
+        
+        chunk_words = self.chunk_words
+        high, low = divmod(start, 1000)
+        
+        while start < stop:
+            count = min(1000 - low, stop - start)
+            
+            if high:
+                prefix = self.convert(high * 1000)
+                spaced = prefix + ' '
+                block = [spaced + words for words in chunk_words[low:low + count]]
+                if low == 0:
+                    block[0] = prefix
+            else:
+                block = chunk_words[low:low + count]
+            
+            yield block
+            
+            start += count
+            high += 1
+            low = 0
+    
+    def iter_range(self, start: int, stop: int):
+        # Yield the words for every number in range(start, stop), in order.
+        for block in self.iter_blocks(start, stop):
+            yield from block
+    
+    def convert_many(self, values):
+        # Convert an array of integers in bulk with NumPy (optional dependency).
+        # Values are split into 3-digit groups with vectorized div/mod, each
+        # group is mapped through its scale's word table by array indexing and
+        # the pieces are joined column by column. Returns an object array of
+        # the same shape; every element equals convert() of the input. Values
+        # outside the 64-bit range go through convert() one at a time.
+        import numpy as np
+        
+        values = np.asarray(values)
+        shape = values.shape
+        flat = values.ravel()
+        
+        # np.asarray([]) is float64, so empty input is answered before the
+        # dtype check.
+        if flat.size == 0:
+            return np.empty(shape, dtype=object)
+        
+        if flat.dtype.kind == 'O':
+            # Python ints: vectorize the ones that fit in int64.
+            fits = np.fromiter((-2 ** 63 <= int(v) < 2 ** 63 for v in flat),
+                               dtype=bool, count=flat.size)
+            result = np.empty(flat.size, dtype=object)
+            result[fits] = self.convert_many(flat[fits].astype(np.int64))
+            result[~fits] = [self.convert(int(v)) for v in flat[~fits]]
+            return result.reshape(shape)
+        
+        if flat.dtype.kind not in 'iu':
+            raise TypeError(f"convert_many needs integers, not {flat.dtype}")
+        
+        # Magnitudes as uint64; ~v == -v - 1 avoids overflowing on the int64 minimum.
+        if flat.dtype.kind == 'i':
+            negative = flat < 0
+            magnitude = flat.astype(np.uint64)
+            magnitude[negative] = (~flat[negative]).astype(np.uint64) + np.uint64(1)
+        else:
+            negative = None
+            magnitude = flat.astype(np.uint64)
+        
+        # For each scale, entries 0-999 are the words followed by a space and
+        # entries 1000-1999 the words alone, for the lowest non-zero group.
+        tables = self._array_tables
+        if tables is None:
+            tables = self._array_tables = [
+                np.array([words + ' ' if words else '' for words in table] + table, dtype=object)
+                for table in self.scaled_chunk_words]
+        
+        groups = []
+        rest = magnitude
+        while rest.size and rest.max() > 0:
+            groups.append((rest % np.uint64(1000)).astype(np.intp))
+            rest = rest // np.uint64(1000)
+        
+        result = np.full(flat.size, '', dtype=object)
+        started = np.zeros(flat.size, dtype=bool)
+        
+        for scale_index, chunk in enumerate(groups):
+            # The first non-zero group seen from the bottom is the last word.
+            last = (chunk != 0) & ~started
+            result = tables[scale_index][chunk + last * 1000] + result
+            started |= last
+        
+        result[~started] = 'zero'
+        if negative is not None and negative.any():
+            result[negative] = 'negative ' + result[negative]
+        
+        return result.reshape(shape)
+    
+    def iter_byte_blocks(self, start: int, stop: int, step: int = 1):
+        # Yield range(start, stop, step) as UTF-8 bytes, one newline-terminated
+        # line per number, in the same blocks as iter_blocks. Each block is
+        # built with a single join of the pre-encoded chunks using
+        # "\n<prefix> " as the separator, so no per-line objects are created.
+        # With step > 1 a block joins a strided slice of the chunks; past a
+        # step of 1000 that is one number per block (see iter_stepped_batches).
+        if start < 1:
+            head = range(start, min(stop, 1), step)
+            if not head:
+                return
+            yield self.encode_many(head)
+            start = head[-1] + step
+        
+        chunk_bytes = self.chunk_bytes
+        
+        while start < stop:
+            high, low = divmod(start, 1000)
+            lows = chunk_bytes[low:min(stop - high * 1000, 1000):step]
+            count = len(lows)
+            
+            if high:
+                prefix = self.convert(high * 1000).encode('utf-8')
+                if low == 0:
+                    head = prefix + b'\n'
+                    lows = lows[1:]
+                else:
+                    head = b''
+                if lows:
+                    block = (head + prefix + b' ' + (b'\n' + prefix + b' ').join(lows)
+                             + b'\n')
+                else:
+                    block = head
+            else:
+                block = b'\n'.join(lows) + b'\n'
+            
+            yield block
+            
+            start += count * step
+    
+    def encode_many(self, values):
+        # Encode any sequence of integers as newline-terminated UTF-8 lines,
+        # in order. When consecutive numbers share everything above their
+        # last group (sorted samples, strides, clustered IDs), the words for
+        # that prefix are converted once and each line is one concatenation.
+        # Unrelated numbers cost no more than convert().
+        chunk_words = self.chunk_words
+        convert = self.convert
+        lines = []
+        append = lines.append
+        last_high = None
+        prefix = None
+        
+        for num in values:
+            if num < 1000:
+                append(chunk_words[num] if num > 0 else convert(num))
+                continue
+            
+            high = num // 1000
+            if high == last_high:
+                if prefix is None:
+                    prefix = convert(high * 1000)
+                low = num - high * 1000
+                append(prefix + ' ' + chunk_words[low] if low else prefix)
+            else:
+                append(convert(num))
+                last_high = high
+                prefix = None
+        
+        append('')
+        return '\n'.join(lines).encode('utf-8')
+    
+    def iter_stepped_batches(self, start: int, stop: int, step: int, batch_size: int):
+        # iter_byte_batches for range(start, stop, step) with step >= 1.
+        # Below a step of 1000 every block of 1000 is still one join, over a
+        # strided slice of the chunk words; larger steps leave one number per
+        # block and go through encode_many.
+        if step < 1:
+            raise ValueError(f"step must be positive, not {step}")
+        
+        if step >= 1000:
+            numbers = range(start, stop, step)
+            size = max(batch_size, 1000)
+            for i in range(0, len(numbers), size):
+                part = numbers[i:i + size]
+                yield len(part), self.encode_many(part)
+            return
+        
+        yield from self.iter_byte_batches(start, stop, batch_size, step)
+    
+    def iter_byte_batches(self, start: int, stop: int, batch_size: int, step: int = 1):
+        # Group iter_byte_blocks into (count, bytes) batches of at least
+        # batch_size numbers (the last one may be shorter). Block sizes follow
+        # from the block boundaries, so the lines are never counted.
+        batch = []
+        batch_count = 0
+        position = start
+        
+        for block in self.iter_byte_blocks(start, stop, step):
+            if position < 1:
+                block_end = min(stop, 1)
+            else:
+                block_end = min(stop, (position // 1000 + 1) * 1000)
+            count = len(range(position, block_end, step))
+            batch.append(block)
+            batch_count += count
+            position += count * step
+            
+            if batch_count >= batch_size:
+                yield batch_count, b''.join(batch)
+                batch = []
+                batch_count = 0
+        
+        if batch:
+            yield batch_count, b''.join(batch)
+
+# Names for scales past the built-in tables follow the Conway-Wechsler
+# system: 1000**(n + 1) is named from the Latin for n plus "illion"
+# (n = 6 -> sextillion, 21 -> unvigintillion, 100 -> centillion), with n
+# written in base 1000 joined by "lli" once it passes 999
+# (n = 1000 -> millinillion). Units take an extra letter depending on the
+# tens or hundreds word that follows them, as marked below.
+LATIN_SMALL = ['ni', 'mi', 'bi', 'tri', 'quadri', 'quinti', 'sexti', 'septi', 'octi', 'noni']
+LATIN_UNITS = ['', 'un', 'duo', 'tre', 'quattuor', 'quinqua', 'se', 'septe', 'octo', 'nove']
+LATIN_TENS = [('', ''), ('deci', 'N'), ('viginti', 'MS'), ('triginta', 'NS'),
+              ('quadraginta', 'NS'), ('quinquaginta', 'NS'), ('sexaginta', 'N'),
+              ('septuaginta', 'N'), ('octoginta', 'MX'), ('nonaginta', '')]
+LATIN_HUNDREDS = [('', ''), ('centi', 'NX'), ('ducenti', 'N'), ('trecenti', 'NS'),
+                  ('quadringenti', 'NS'), ('quingenti', 'NS'), ('sescenti', 'N'),
+                  ('septingenti', 'N'), ('octingenti', 'MX'), ('nongenti', '')]
+LATIN_UNIT_CHANGES = {'tre': {'S': 'tres', 'X': 'tres'}, 'se': {'S': 'ses', 'X': 'sex'},
+                      'septe': {'M': 'septem', 'N': 'septen'},
+                      'nove': {'M': 'novem', 'N': 'noven'}}
+
+_latin_prefixes = None
+_latin_values = None
+
+
+def latin_prefix(n):
+    # Conway-Wechsler prefix for 0 <= n < 1000, ending in 'i'.
+    if n < 10:
+        return LATIN_SMALL[n]
+    
+    hundreds, rest = divmod(n, 100)
+    tens, units = divmod(rest, 10)
+    tens_word, tens_marks = LATIN_TENS[tens]
+    hundreds_word, hundreds_marks = LATIN_HUNDREDS[hundreds]
+    marks = tens_marks if tens else hundreds_marks
+    
+    unit = LATIN_UNITS[units]
+    for mark, changed in LATIN_UNIT_CHANGES.get(unit, {}).items():
+        if mark in marks:
+            unit = changed
+            break
+    
+    return (unit + tens_word + hundreds_word)[:-1] + 'i'
+
+
+def scale_name(index):
+    # Name of 1000**index: '' for 0, 'thousand', 'million', ... with no
+    # upper limit.
+    if index < 2:
+        return ['', 'thousand'][index]
+    
+    global _latin_prefixes
+    if _latin_prefixes is None:
+        _latin_prefixes = [latin_prefix(n) for n in range(1000)]
+    
+    n = index - 1
+    prefixes = []
+    while n:
+        n, group = divmod(n, 1000)
+        prefixes.append(_latin_prefixes[group])
+    prefixes.reverse()
+    
+    return 'lli'.join(prefixes) + 'llion'
+
+
+def scale_index(name):
+    # Inverse of scale_name: the index of a scale word, or None if name is
+    # not one (only the exact form scale_name produces is accepted).
+    if name == 'thousand':
+        return 1
+    if not name.endswith('llion'):
+        return None
+    
+    global _latin_values
+    if _latin_values is None:
+        _latin_values = {latin_prefix(n): n for n in range(1000)}
+    
+    n = 0
+    for prefix in name[:-5].split('lli'):
+        group = _latin_values.get(prefix)
+        if group is None:
+            return None
+        n = n * 1000 + group
+    
+    if not n or scale_name(n + 1) != name:
+        return None
+    return n + 1
+
+
+def int_to_digits(num):
+    # Decimal digits of a non-negative int. str() is quadratic and, from
+    # Python 3.11, refuses more than 4300 digits, so big values are split
+    # on powers of two and rebuilt with the decimal module, whose
+    # multiplication is subquadratic for long operands.
+    if num.bit_length() <= 8192:
+        return str(num)
+    
+    import decimal
+    
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                              Emin=decimal.MIN_EMIN)
+    powers = {}
+    
+    def power_of_two(bits):
+        power = powers.get(bits)
+        if power is None:
+            if bits <= 4096:
+                power = decimal.Decimal(1 << bits)
+            else:
+                half = bits // 2
+                power = context.multiply(power_of_two(half), power_of_two(bits - half))
+            powers[bits] = power
+        return power
+    
+    def split(n, bits):
+        if bits <= 4096:
+            return decimal.Decimal(n)
+        # Split at a power of two so the powers are shared between calls.
+        low_bits = 1 << (bits.bit_length() - 2)
+        high = n >> low_bits
+        low = n - (high << low_bits)
+        return context.add(context.multiply(split(high, bits - low_bits), power_of_two(low_bits)),
+                           split(low, low_bits))
+    
+    return str(split(num, num.bit_length()))
+
+
+def int_from_digits(text):
+    # int(text) for a string of decimal digits of any length, splitting long
+    # strings in half so int()'s digit limit and quadratic cost are avoided.
+    if len(text) <= 3000:
+        return int(text)
+    
+    powers = {}
+    
+    def join(digits):
+        if len(digits) <= 3000:
+            return int(digits)
+        low_digits = len(digits) // 2
+        power = powers.get(low_digits)
+        if power is None:
+            power = powers[low_digits] = 10 ** low_digits
+        return join(digits[:-low_digits]) * power + join(digits[-low_digits:])
+    
+    return join(text)
+
+
+def group_chunks(num):
+    # The 3-digit groups of a positive int, least significant first, read
+    # from its digits instead of by repeated divmod.
+    digits = int_to_digits(num)
+    return [int(digits[max(0, i - 3):i]) for i in range(len(digits), 0, -3)]
+
+
+def int_from_groups(groups):
+    # Sum of groups[k] * 1000**k for non-negative ints that may exceed 999.
+    # The carries are settled in one pass and the digits converted with
+    # int_from_digits, instead of adding up big products.
+    parts = []
+    carry = 0
+    for value in groups:
+        carry, group = divmod(value + carry, 1000)
+        parts.append(f'{group:03d}')
+    parts.append(str(carry))
+    parts.reverse()
+    return int_from_digits(''.join(parts))
+
+
+class MemoizedConverter:
+    # Bounded LRU cache in front of NumberToWords.convert for skewed inputs
+    # where the same values keep coming back. Built on functools.lru_cache,
+    # which is implemented in C and safe to share between threads. It does
+    # not count evictions, so stats() estimates them as misses - current
+    # size. That is exact for a single thread. When threads share the cache,
+    # two that miss the same key at once both count a miss but store one
+    # entry, so the estimate can run high.
+    
+    def __init__(self, converter=None, maxsize=65536):
+        from functools import lru_cache
+        
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        
+        self.converter = converter or NumberToWords()
+        self.maxsize = maxsize
+        self.convert = lru_cache(maxsize=maxsize)(self.converter.convert)
+    
+    def stats(self) -> dict:
+        # Counters for sizing the cache; 'evictions' is the estimate above.
+        info = self.convert.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'evictions': info.misses - info.currsize,
+            'size': info.currsize,
+            'maxsize': self.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+    
+    def clear(self):
+        # Drop every cached entry and reset the counters.
+        self.convert.cache_clear()
+
+
+class WordsFileReader:
+    # Random access to a generated file ('\n' line endings, one number per
+    # line starting at start). Line offsets are computed from the chunk word
+    # lengths, so a lookup is one seek into a memory map with no scanning.
+    
+    def __init__(self, path, start=1, converter=None):
+        self.converter = converter or NumberToWords()
+        self.start = start
+        self._file = open(path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b''  # mmap cannot map an empty file
+    
+    def offset(self, num: int) -> int:
+        # Byte offset of the line for num.
+        return self.converter.line_offset(num, self.start)
+    
+    def lookup(self, num: int) -> str:
+        # Return the words on the line for num.
+        offset = self.offset(num)
+        end = self._map.find(b'\n', offset)
+        if offset >= self.size or end < 0:
+            raise IndexError(f"{num} is not in {self._file.name}")
+        return self._map[offset:end].decode('utf-8')
+    
+    def lines(self, first: int, stop: int) -> list:
+        # Return the lines for range(first, stop) with one slice of the map.
+        if stop <= first:
+            return []
+        offset = self.offset(first)
+        end = offset + self.converter.output_size(first, stop - 1)
+        if end > self.size:
+            raise IndexError(f"{stop - 1} is not in {self._file.name}")
+        return self._map[offset:end].decode('utf-8').split('\n')[:-1]
+    
+    def close(self):
+        if self.size:
+            self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+# How often (seconds) generation records a checkpoint next to the output.
+CHECKPOINT_INTERVAL = 5.0
+
+
+def checkpoint_path(output_file):
+    # Checkpoints live next to the output file.
+    return output_file + '.checkpoint'
+
+
+def write_checkpoint(output_file, end_number, last_number, offset):
+    # Record that lines 1..last_number (offset bytes) are fully written.
+    # Written to a temp file and renamed so a crash never leaves half a checkpoint.
+    import json
+    
+    path = checkpoint_path(output_file)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'end_number': end_number, 'last_number': last_number, 'offset': offset}, f)
+    os.replace(path + '.tmp', path)
+
+
+def read_checkpoint(output_file):
+    # Return the checkpoint for output_file, or None if there isn't one.
+    import json
+    
+    try:
+        with open(checkpoint_path(output_file), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def remove_checkpoint(output_file):
+    path = checkpoint_path(output_file)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def prepare_resume(converter, output_file):
+    # Check output_file against its checkpoint, keep any whole lines written
+    # after it that match, truncate the rest (including a partial last line)
+    # and return (next_number, end_number) to continue from.
+    checkpoint = read_checkpoint(output_file)
+    if checkpoint is None:
+        raise ValueError(f"No checkpoint found for {output_file}")
+    
+    end_number = checkpoint['end_number']
+    last = checkpoint['last_number']
+    offset = checkpoint['offset']
+    size = os.path.getsize(output_file)
+    
+    if offset != converter.line_offset(last + 1) or size < offset:
+        raise ValueError(f"Checkpoint does not match {output_file}")
+    
+    with open(output_file, 'r+b') as f:
+        # The last checkpointed line must be intact.
+        if last:
+            tail = converter.convert(last).encode('utf-8') + b'\n'
+            f.seek(offset - len(tail))
+            if f.read(len(tail)) != tail:
+                raise ValueError(f"Line {last:,} in {output_file} does not match its checkpoint")
+        
+        # Keep the lines written after the checkpoint while they match.
+        fits = min(converter.last_number_within(size), end_number)
+        f.seek(offset)
+        for block in converter.iter_byte_blocks(last + 1, fits + 1):
+            data = f.read(len(block))
+            if data == block:
+                last += block.count(b'\n')
+                continue
+            
+            position = 0
+            for line in block.splitlines(keepends=True):
+                if data[position:position + len(line)] != line:
+                    break
+                position += len(line)
+                last += 1
+            break
+        
+        f.truncate(converter.line_offset(last + 1))
+    
+    return last + 1, end_number
+
+# Per-process state for sharded generation, set up by init_shard_worker.
+_shard_converter = None
+_shard_progress = None
+_shard_stop = None
+
+
+def init_shard_worker(progress, stop_event):
+    # Process pool initializer: one converter per worker plus the shared
+    # progress queue and stop event.
+    global _shard_converter, _shard_progress, _shard_stop
+    _shard_converter = NumberToWords()
+    _shard_progress = progress
+    _shard_stop = stop_event
+
+
+def generate_shard(start, stop, path, report_every):
+    # Write range(start, stop) to path as bytes blocks and return how many
+    # numbers were written. Progress is reported as counts since the last put.
+    written = 0
+    pending = 0
+    
+    with open(path, 'wb') as f:
+        for block in _shard_converter.iter_byte_blocks(start, stop):
+            if _shard_stop.is_set():
+                break
+            
+            f.write(block)
+            count = block.count(b'\n')
+            written += count
+            pending += count
+            
+            if pending >= report_every:
+                _shard_progress.put(pending)
+                pending = 0
+    
+    if pending:
+        _shard_progress.put(pending)
+    
+    return written
+
+
+def preallocate(f, size):
+    # Reserve size bytes for an open binary file where the platform supports
+    # it. Callers truncate to the final position when they are done.
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass
+
+
+def split_range(start, stop, shards):
+    # Split range(start, stop) into contiguous (start, stop) pairs, with the
+    # boundaries rounded to multiples of 1000 so shards start on whole blocks.
+    step = -(-(stop - start) // shards)
+    step = max(1000, -(-step // 1000) * 1000)
+    
+    bounds = []
+    lo = start
+    while lo < stop:
+        hi = min((lo // 1000) * 1000 + step, stop)
+        bounds.append((lo, hi))
+        lo = hi
+    
+    return bounds
+
+
+
+def generate_sharded(out, start, stop, workers, part_prefix, report_every=10000,
+                     on_progress=None, should_stop=None, on_merged=None):
+    # Generate range(start, stop) on a pool of worker processes. Contiguous
+    # shards are written to part files named <part_prefix>.part<k> and copied
+    # into the binary file out in numeric order as soon as every shard before
+    # them is done. After a stop, only the shards up to and including the
+    # first incomplete one are copied, so out always gets a contiguous run
+    # from start. Returns how many numbers were copied.
+    # on_progress(done) is called about five times a second with the total
+    # from every worker; should_stop() is polled just as often. on_merged(copied)
+    # is called after each shard is copied, with the numbers copied so far.
+    import multiprocessing
+    import queue
+    import shutil
+    from concurrent.futures import ProcessPoolExecutor, wait
+    
+    shards = split_range(start, stop, workers * 4)
+    part_files = [f"{part_prefix}.part{k}" for k in range(len(shards))]
+    
+    try:
+        context = multiprocessing.get_context()
+        worker_progress = context.Queue()
+        stop_event = context.Event()
+        done = 0
+        copied = 0
+        merged = 0
+        complete = True
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=init_shard_worker,
+                                 initargs=(worker_progress, stop_event)) as pool:
+            futures = [pool.submit(generate_shard, lo, hi, path, report_every)
+                       for (lo, hi), path in zip(shards, part_files)]
+            pending = set(futures)
+            
+            while complete and merged < len(futures):
+                if should_stop is not None and should_stop():
+                    stop_event.set()
+                
+                _, pending = wait(pending, timeout=0.2)
+                
+                # Aggregate worker progress
+                try:
+                    while True:
+                        done += worker_progress.get_nowait()
+                except queue.Empty:
+                    pass
+                
+                if on_progress is not None:
+                    on_progress(done)
+                
+                # Copy the finished shards that follow the ones already copied
+                while complete and merged < len(futures) and futures[merged].done():
+                    count = futures[merged].result()
+                    lo, hi = shards[merged]
+                    with open(part_files[merged], 'rb') as part:
+                        shutil.copyfileobj(part, out, 1 << 20)
+                    os.remove(part_files[merged])
+                    copied += count
+                    merged += 1
+                    complete = count == hi - lo
+                    if on_merged is not None:
+                        on_merged(copied)
+            
+            # Shards after an incomplete one are not copied; let them stop.
+            stop_event.set()
+        
+        return copied
+    
+    finally:
+        for path in part_files:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+# Sorted output is an external merge sort: the range is cut into runs that
+# fit the memory budget, each run is sorted and spilled to a temporary file,
+# and the runs are merged. SORT_LINE_OVERHEAD approximates the memory per
+# line held in a list beyond its bytes (object header, alignment, list slot
+# and sort scratch space). A merge reads every run MERGE_BUFFER bytes or
+# more at a time, so budgets below SORT_MEMORY_MIN cannot be kept to.
+SORT_MEMORY = 512 * 1024 * 1024
+SORT_MEMORY_MIN = 1024 * 1024
+SORT_LINE_OVERHEAD = 96
+MERGE_FAN_IN = 128
+MERGE_BUFFER = 1 << 16
+
+
+def write_sorted_run(converter, start, stop, path, report=None, stopped=None):
+    # Sort the lines for range(start, stop) in memory and write them to path.
+    # iter_sorted_blocks hands over ~1000-line blocks that are already
+    # sorted, so Timsort only has to merge them. report(count) is called
+    # as lines are produced; returns False if stopped() said to give up.
+    lines = []
+    pending = 0
+    
+    for block in converter.iter_sorted_blocks(start, stop):
+        if stopped is not None and stopped():
+            return False
+        
+        lines += block
+        pending += len(block)
+        if report is not None and pending >= 100000:
+            report(pending)
+            pending = 0
+    
+    lines.sort()
+    with open(path, 'wb') as f:
+        # Joined a slice at a time, so the copy stays small next to the run.
+        for first in range(0, len(lines), 4096):
+            f.write(b'\n'.join(lines[first:first + 4096]))
+            f.write(b'\n')
+    
+    if report is not None and pending:
+        report(pending)
+    return True
+
+
+def generate_sorted_run(start, stop, path):
+    # Process pool task for write_sorted (see init_shard_worker).
+    return write_sorted_run(_shard_converter, start, stop, path,
+                            _shard_progress.put, _shard_stop.is_set)
+
+
+def merge_sorted_runs(paths, out, buffer_size, report=None, stopped=None):
+    # k-way merge of sorted run files into the binary file out. Runs are
+    # read buffer_size bytes of lines at a time. Lines from one block stay
+    # together in a run, so instead of a heap step per line, the run with the
+    # smallest head gives up, in one slice, every line that sorts before the
+    # next run's head (found with bisect). '\n' sorts before every other
+    # character in the words, so whole lines compare like the bare words.
+    # Returns how many lines were written.
+    import heapq
+    from bisect import bisect_left
+    
+    files = [open(path, 'rb') for path in paths]
+    written = 0
+    
+    try:
+        chunks = [f.readlines(buffer_size) for f in files]
+        positions = [0] * len(files)
+        heap = [(chunk[0], k) for k, chunk in enumerate(chunks) if chunk]
+        heapq.heapify(heap)
+        
+        while heap:
+            _, k = heap[0]
+            chunk = chunks[k]
+            position = positions[k]
+            
+            if len(heap) > 1:
+                following = min(heap[1:3])[0]
+                end = bisect_left(chunk, following, position)
+            else:
+                end = len(chunk)
+            
+            for first in range(position, end, 4096):
+                out.write(b''.join(chunk[first:min(first + 4096, end)]))
+            written += end - position
+            if report is not None:
+                report(end - position)
+            
+            if end < len(chunk):
+                positions[k] = end
+                heapq.heapreplace(heap, (chunk[end], k))
+                continue
+            
+            if stopped is not None and stopped():
+                break
+            
+            chunk = chunks[k] = files[k].readlines(buffer_size)
+            positions[k] = 0
+            if chunk:
+                heapq.heapreplace(heap, (chunk[0], k))
+            else:
+                heapq.heappop(heap)
+    finally:
+        for f in files:
+            f.close()
+    
+    return written
+
+
+def write_sorted(out, start, stop, memory=SORT_MEMORY, workers=1, temp_dir=None,
+                 on_progress=None, should_stop=None):
+    # Write the lines for range(start, stop) to the binary file out in
+    # lexicographic (byte) order, within about `memory` bytes (at least
+    # SORT_MEMORY_MIN; the converter's own tables are not counted). Runs
+    # sized from the longest line in the range are sorted by up to `workers`
+    # processes (splitting the budget between them) and spilled to a
+    # temporary directory under temp_dir; as many of them as the budget has
+    # merge buffers for, up to MERGE_FAN_IN, are merged at a time until one
+    # pass can write out. Returns how many lines were written.
+    # on_progress(done) counts each number half when it is sorted into a run
+    # and half when it is merged; should_stop() is checked between batches.
+    import shutil
+    import tempfile
+    
+    if memory < SORT_MEMORY_MIN:
+        raise ValueError(f"A sort needs at least {SORT_MEMORY_MIN:,} bytes of memory, "
+                         f"not {memory:,}")
+    if start >= stop:
+        return 0
+    
+    converter = NumberToWords()
+    total = stop - start
+    
+    # Longest line in the range, to size the runs safely.
+    longest = 4
+    if stop > 1:
+        longest = max(longest, converter.extreme_line(max(start, 1), stop - 1)[0])
+    if start < 0:
+        longest = max(longest, 9 + converter.extreme_line(max(1, 1 - stop), -start)[0])
+    
+    # Runs are whole 1000-line blocks, so a small budget runs fewer workers.
+    line_cost = longest + 1 + SORT_LINE_OVERHEAD
+    workers = max(1, min(workers, memory // (1000 * line_cost)))
+    run_size = max(1000, memory // workers // line_cost // 1000 * 1000)
+    
+    # Lines read back as lists take about twice their size in memory, and a
+    # merge of k runs holds k + 1 buffers (the extra one covers the output).
+    fan_in = max(2, min(MERGE_FAN_IN, memory // (2 * MERGE_BUFFER) - 1))
+    
+    runs = []
+    lo = start
+    while lo < stop:
+        hi = min((lo // 1000) * 1000 + run_size, stop)
+        runs.append((lo, hi))
+        lo = hi
+    
+    converted = 0
+    merged = 0
+    
+    def report_converted(count):
+        nonlocal converted
+        converted += count
+        if on_progress is not None:
+            on_progress((converted + merged) // 2)
+    
+    def report_merged(count):
+        nonlocal merged
+        merged += count
+        if on_progress is not None:
+            on_progress((converted + merged) // 2)
+    
+    work_dir = tempfile.mkdtemp(prefix='number_words_sort_', dir=temp_dir)
+    try:
+        paths = [os.path.join(work_dir, f'run{k}') for k in range(len(runs))]
+        
+        if workers > 1 and len(runs) > 1:
+            complete = sort_runs_in_pool(runs, paths, workers, report_converted, should_stop)
+        else:
+            complete = all(write_sorted_run(converter, lo, hi, path, report_converted, should_stop)
+                           for (lo, hi), path in zip(runs, paths))
+        if not complete:
+            return 0
+        
+        # Merge passes until few enough runs are left for the final one.
+        generation = 0
+        while len(paths) > fan_in:
+            merged_paths = []
+            for k in range(0, len(paths), fan_in):
+                group = paths[k:k + fan_in]
+                path = os.path.join(work_dir, f'merge{generation}_{k}')
+                with open(path, 'wb') as f:
+                    merge_sorted_runs(group, f, memory // (2 * len(group) + 2))
+                for run_path in group:
+                    os.remove(run_path)
+                merged_paths.append(path)
+            paths = merged_paths
+            generation += 1
+        
+        if len(paths) == 1:
+            with open(paths[0], 'rb') as run:
+                shutil.copyfileobj(run, out, 1 << 20)
+            report_merged(total)
+            return total
+        
+        buffer_size = min(16 << 20, memory // (2 * len(paths) + 2))
+        return merge_sorted_runs(paths, out, buffer_size, report_merged, should_stop)
+    
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def sort_runs_in_pool(runs, paths, workers, report, should_stop=None):
+    # write_sorted's run phase on a process pool, polling progress and
+    # should_stop() like generate_sharded. Returns False if stopped.
+    import multiprocessing
+    import queue
+    from concurrent.futures import ProcessPoolExecutor, wait
+    
+    context = multiprocessing.get_context()
+    worker_progress = context.Queue()
+    stop_event = context.Event()
+    
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_shard_worker,
+                             initargs=(worker_progress, stop_event)) as pool:
+        futures = [pool.submit(generate_sorted_run, lo, hi, path)
+                   for (lo, hi), path in zip(runs, paths)]
+        pending = set(futures)
+        
+        while pending:
+            if should_stop is not None and should_stop():
+                stop_event.set()
+            
+            _, pending = wait(pending, timeout=0.2)
+            
+            try:
+                while True:
+                    report(worker_progress.get_nowait())
+            except queue.Empty:
+                pass
+        
+        return all(future.result() for future in futures)
+
+
+def verify_range(path, start, lo, hi, batch_size=100000):
+    # Compare the lines for range(lo, hi) in the generated file at path
+    # (whose first line is start) with the expected bytes, batch by batch
+    # straight out of a memory map. Returns None if they all match, otherwise
+    # (number, offset) of the first line that differs.
+    converter = NumberToWords()
+    offset = converter.line_offset(lo, start)
+    
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for count, expected in converter.iter_byte_batches(lo, hi, batch_size):
+            end = offset + len(expected)
+            if data[offset:end] != expected:
+                # Narrow it down to the first line that differs.
+                num = lo
+                for line in expected.splitlines(keepends=True):
+                    if data[offset:offset + len(line)] != line:
+                        return num, offset
+                    offset += len(line)
+                    num += 1
+            offset = end
+            lo += count
+    
+    return None
+
+
+def verify_file(path, start=1, end=None, workers=1, batch_size=100000):
+    # Check that the file at path holds exactly the lines for start..end,
+    # in order, with nothing missing, repeated, truncated or left over. When
+    # end is None it is taken from the file size. The expected lines come
+    # from the block generator, so nothing is converted from scratch. With
+    # workers > 1 the range is split at line boundaries and checked on a
+    # process pool. Returns a dict with 'ok' and, on failure, 'mismatch':
+    # the first bad line's number and byte offset, and the expected and
+    # found text.
+    converter = NumberToWords()
+    started = time.time()
+    size = os.path.getsize(path)
+    
+    fits = converter.last_number_within(size, start)
+    if end is None:
+        end = fits
+    fits = min(fits, end)
+    
+    mismatch = None
+    if fits >= start and size:
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            shards = split_range(start, fits + 1, workers * 4)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(verify_range, [path] * len(shards), [start] * len(shards),
+                                   [lo for lo, _ in shards], [hi for _, hi in shards],
+                                   [batch_size] * len(shards))
+                mismatch = next((result for result in results if result), None)
+        else:
+            mismatch = verify_range(path, start, start, fits + 1, batch_size)
+    
+    expected_size = converter.output_size(start, end)
+    if mismatch is None and fits < end:
+        mismatch = (fits + 1, converter.line_offset(fits + 1, start))  # truncated
+    elif mismatch is None and size > expected_size:
+        mismatch = (end + 1, expected_size)  # data left over after the last line
+    
+    result = {
+        'ok': mismatch is None,
+        'path': path,
+        'start': start,
+        'end': end,
+        'lines': (mismatch[0] if mismatch else end + 1) - start,
+        'size': size,
+        'elapsed': time.time() - started,
+    }
+    
+    if mismatch:
+        num, offset = mismatch
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            found = f.readline(200).decode('utf-8', 'replace').rstrip('\n')
+        result['mismatch'] = {
+            'number': num,
+            'offset': offset,
+            'expected': converter.convert(num) if num <= end else '',
+            'found': found,
+        }
+    
+    return result
+
+
+# Compressed output: the range is cut into frames of whole lines, each frame
+# compressed on its own (concatenated gzip members, bz2 streams and xz
+# streams are all still valid files for the usual tools). A JSON index next
+# to the file records where every frame starts, so any number range can be
+# read back by decompressing only the frames that hold it.
+COMPRESSED_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+
+def codec_for_path(path):
+    # The compression codec implied by path's extension, or None.
+    return COMPRESSED_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def index_path(path):
+    return path + '.idx'
+
+
+def compressor(codec, level=None):
+    # One-shot compress function for codec.
+    if codec == 'gzip':
+        import gzip
+        return lambda data: gzip.compress(data, 6 if level is None else level, mtime=0)
+    if codec == 'bz2':
+        import bz2
+        return lambda data: bz2.compress(data, 9 if level is None else level)
+    if codec == 'xz':
+        import lzma
+        return lambda data: lzma.compress(data, preset=6 if level is None else level)
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def decompressor(codec):
+    # One-shot decompress function for codec.
+    if codec == 'gzip':
+        import gzip
+        return gzip.decompress
+    if codec == 'bz2':
+        import bz2
+        return bz2.decompress
+    if codec == 'xz':
+        import lzma
+        return lzma.decompress
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def write_compressed(path, start, stop, codec, frame_size=100000, workers=None, level=None,
+                     on_progress=None, should_stop=None):
+    # Write range(start, stop) to path as independently compressed frames of
+    # at least frame_size lines, plus the frame index at index_path(path).
+    # Frames are compressed on a thread pool (zlib, bz2 and lzma release the
+    # GIL) while the next ones are generated; at most two per worker are in
+    # flight, and they are written in order. After a stop the file and index
+    # hold every frame finished so far. Returns how many numbers were written.
+    import json
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    
+    compress = compressor(codec, level)
+    workers = workers or os.cpu_count() or 1
+    converter = NumberToWords()
+    frames = []
+    in_flight = deque()
+    offset = 0
+    written = 0
+    
+    with open(path, 'wb') as out, ThreadPoolExecutor(max_workers=workers) as pool:
+        
+        def drain(limit):
+            nonlocal offset, written
+            while len(in_flight) > limit:
+                first, count, future = in_flight.popleft()
+                data = future.result()
+                out.write(data)
+                frames.append([first, count, offset, len(data)])
+                offset += len(data)
+                written += count
+                if on_progress is not None:
+                    on_progress(written)
+        
+        first = start
+        for count, data in converter.iter_byte_batches(start, stop, frame_size):
+            if should_stop is not None and should_stop():
+                break
+            in_flight.append((first, count, pool.submit(compress, data)))
+            first += count
+            drain(workers * 2)
+        
+        drain(0)
+    
+    with open(index_path(path), 'w', encoding='utf-8') as f:
+        json.dump({'codec': codec, 'start': start, 'end': start + written - 1,
+                   'frames': frames}, f)
+    
+    return written
+
+
+class CompressedWordsReader:
+    # Random access to a file written by write_compressed. Only the frames
+    # holding the requested numbers are read and decompressed; offsets inside
+    # a frame come from output_size, so no lines are scanned.
+    
+    def __init__(self, path, converter=None):
+        import json
+        from bisect import bisect_right
+        
+        with open(index_path(path), encoding='utf-8') as f:
+            index = json.load(f)
+        
+        self.converter = converter or NumberToWords()
+        self.start = index['start']
+        self.end = index['end']
+        self.frames = index['frames']
+        self._firsts = [frame[0] for frame in self.frames]
+        self._bisect = bisect_right
+        self._decompress = decompressor(index['codec'])
+        self._file = open(path, 'rb')
+        self._cached = (None, b'')
+    
+    def frame_data(self, frame_index):
+        # Decompressed bytes of one frame (the last one read is kept).
+        if self._cached[0] != frame_index:
+            _, _, offset, length = self.frames[frame_index]
+            self._file.seek(offset)
+            self._cached = (frame_index, self._decompress(self._file.read(length)))
+        return self._cached[1]
+    
+    def lines(self, first: int, stop: int) -> list:
+        # Return the lines for range(first, stop).
+        if first < self.start or stop - 1 > self.end:
+            raise IndexError(f"{first}..{stop - 1} is not within {self.start}..{self.end}")
+        
+        result = []
+        num = first
+        while num < stop:
+            frame_index = self._bisect(self._firsts, num) - 1
+            frame_first, count, _, _ = self.frames[frame_index]
+            frame_stop = min(stop, frame_first + count)
+            
+            begin = self.converter.output_size(frame_first, num - 1)
+            end = begin + self.converter.output_size(num, frame_stop - 1)
+            data = self.frame_data(frame_index)[begin:end]
+            result.extend(data.decode('utf-8').split('\n')[:-1])
+            num = frame_stop
+        
+        return result
+    
+    def lookup(self, num: int) -> str:
+        # Return the words on the line for num.
+        return self.lines(num, num + 1)[0]
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GenerationStats:
+    # Counters published by a generation loop for whoever reports progress.
+    # There is one writer, the generating thread, and it publishes all the
+    # counters as a single tuple, so readers on other threads need no lock
+    # and always see a consistent set (at worst one write behind).
+    
+    def __init__(self, start=1, end=None, step=1):
+        # start=None counts arbitrary inputs (see write_numbers), with no
+        # last number or total.
+        self.start = start
+        self.end = end
+        self.step = step
+        self.started_at = time.perf_counter()
+        # (numbers, bytes, writes, convert_seconds, write_seconds, max_write_latency)
+        self.totals = (0, 0, 0, 0.0, 0.0, 0.0)
+        self.last_block = None
+    
+    def record(self, count, size, convert_seconds=0.0, write_seconds=0.0, block=None):
+        # Account for one write of count numbers / size bytes. block, if
+        # given, is kept for previews; it is only referenced, never copied.
+        numbers, total_bytes, writes, converting, writing, max_latency = self.totals
+        if block is not None:
+            self.last_block = block
+        self.totals = (numbers + count, total_bytes + size, writes + 1,
+                       converting + convert_seconds, writing + write_seconds,
+                       max(max_latency, write_seconds))
+    
+    def set_totals(self, numbers, size):
+        # For loops that only know running totals (sharded or compressed output).
+        _, _, writes, converting, writing, max_latency = self.totals
+        self.totals = (numbers, size, writes + 1, converting, writing, max_latency)
+    
+    def snapshot(self):
+        # Current counters plus derived rates as a plain dict.
+        numbers, total_bytes, writes, converting, writing, max_latency = self.totals
+        elapsed = time.perf_counter() - self.started_at
+        total = None
+        if self.start is not None and self.end is not None:
+            total = len(range(self.start, self.end + 1, self.step))
+        
+        return {
+            'start': self.start,
+            'end': self.end,
+            'step': self.step,
+            'elapsed': elapsed,
+            'numbers': numbers,
+            'last_number': None if self.start is None else self.start + (numbers - 1) * self.step,
+            'total': total,
+            'percent': None if total is None else numbers / total * 100 if total else 100.0,
+            'bytes': total_bytes,
+            'writes': writes,
+            'rate': numbers / elapsed if elapsed > 0 else 0.0,
+            'byte_rate': total_bytes / elapsed if elapsed > 0 else 0.0,
+            'convert_seconds': converting,
+            'write_seconds': writing,
+            'mean_write_latency': writing / writes if writes else 0.0,
+            'max_write_latency': max_latency,
+            'block': self.last_block,
+        }
+
+
+class ProgressSampler:
+    # Calls report(snapshot) every interval seconds from a background thread
+    # while a generation loop fills in a GenerationStats, and once more when
+    # stopped. The loop itself never reports, so the cost and frequency of
+    # progress updates do not depend on the batch size. Each snapshot also
+    # carries 'recent_rate', the numbers/sec since the previous sample, and
+    # 'final', which is True only for the sample taken by stop().
+    
+    def __init__(self, stats, report, interval=0.25):
+        import threading
+        
+        self.stats = stats
+        self.report = report
+        self.interval = interval
+        self.previous = (stats.started_at, 0)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def sample(self, final=False):
+        snapshot = self.stats.snapshot()
+        snapshot['final'] = final
+        now = self.stats.started_at + snapshot['elapsed']
+        then, numbers = self.previous
+        snapshot['recent_rate'] = (snapshot['numbers'] - numbers) / (now - then) if now > then else 0.0
+        self.previous = (now, snapshot['numbers'])
+        self.report(snapshot)
+    
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        # Stop sampling and report the final counters.
+        self._stop_event.set()
+        self._thread.join()
+        self.sample(final=True)
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+FSYNC_POLICIES = ('none', 'end', 'interval', 'always')
+
+
+class PipelinedWriter:
+    # Writes on a dedicated thread so conversion carries on while a write
+    # blocks (slow disks, network volumes). write() copies each block into
+    # the current buffer; once batch_size numbers are in it, the buffer goes
+    # through a bounded queue to the writer thread and comes back to a pool
+    # of `buffers` reusable bytearrays, so memory stays flat. Buffers only
+    # ever grow, so after the first few batches nothing is reallocated.
+    # Batches under min_write bytes are merged, since handing tiny writes to
+    # another thread costs more than it saves.
+    #
+    # fsync is one of FSYNC_POLICIES: 'none', 'end' (once on close),
+    # 'interval' (every fsync_interval seconds) or 'always' (after every
+    # write). drop_cache advises the kernel to drop written pages once they
+    # are synced, so a huge sequential write does not push everything else
+    # out of the page cache; it needs an fsync policy other than 'none'.
+    # With stats (a GenerationStats) the writer thread records every write.
+    # A write error is raised from the next write(), flush() or close().
+    
+    def __init__(self, f, batch_size=100000, buffers=3, fsync='none',
+                 fsync_interval=CHECKPOINT_INTERVAL, drop_cache=False, stats=None,
+                 min_write=256 * 1024):
+        import queue
+        import threading
+        
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}, not {fsync!r}")
+        if drop_cache and fsync == 'none':
+            raise ValueError("drop_cache needs an fsync policy other than 'none'")
+        if batch_size < 1 or buffers < 1:
+            raise ValueError("batch_size and buffers must be positive")
+        
+        self.file = f
+        self.batch_size = batch_size
+        self.min_write = min_write
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.drop_cache = drop_cache and hasattr(os, 'posix_fadvise')
+        self.stats = stats
+        self.error = None
+        self.closed = False
+        
+        self._free = queue.Queue()
+        for _ in range(buffers):
+            self._free.put(bytearray())
+        self._full = queue.Queue(maxsize=buffers)
+        
+        self._buffer = None
+        self._length = 0
+        self._count = 0
+        self._last_block = None
+        self._converting = 0.0
+        self._returned = time.perf_counter()
+        
+        seekable = f.seekable()
+        self._offset = f.tell() if seekable else 0
+        self._dropped = self._offset
+        self._last_sync = time.perf_counter()
+        if seekable and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def write(self, data, count):
+        # Queue data (count numbers' worth of lines) for writing.
+        began = time.perf_counter()
+        self._converting += began - self._returned
+        
+        if self._buffer is None:
+            self._buffer = self._free.get()
+            if self.error is not None:
+                raise self.error
+        
+        buffer = self._buffer
+        end = self._length + len(data)
+        if end <= len(buffer):
+            buffer[self._length:end] = data
+        else:
+            buffer[self._length:] = data  # grows the buffer for good
+        self._length = end
+        self._count += count
+        self._last_block = data
+        
+        if self._count >= self.batch_size and end >= self.min_write:
+            self._submit()
+        
+        self._returned = time.perf_counter()
+    
+    def _submit(self):
+        self._full.put((self._buffer, self._length, self._count, self._converting,
+                        self._last_block))
+        self._buffer = None
+        self._length = 0
+        self._count = 0
+        self._converting = 0.0
+    
+    def _run(self):
+        clock = time.perf_counter
+        
+        while True:
+            item = self._full.get()
+            try:
+                if item is None:
+                    return
+                buffer, length, count, converting, block = item
+                
+                # After an error keep draining, so write() never waits forever.
+                if self.error is None:
+                    try:
+                        began = clock()
+                        with memoryview(buffer)[:length] as view:
+                            self.file.write(view)
+                        self._offset += length
+                        
+                        if self.fsync == 'always' or (
+                                self.fsync == 'interval'
+                                and began - self._last_sync >= self.fsync_interval):
+                            self._sync()
+                        
+                        if self.stats is not None:
+                            self.stats.record(count, length, converting, clock() - began, block)
+                    except BaseException as e:
+                        self.error = e
+                
+                self._free.put(buffer)
+            finally:
+                self._full.task_done()
+    
+    def _sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self._last_sync = time.perf_counter()
+        
+        if self.drop_cache:
+            start = self._dropped - self._dropped % mmap.PAGESIZE
+            os.posix_fadvise(self.file.fileno(), start, self._offset - start,
+                             os.POSIX_FADV_DONTNEED)
+            self._dropped = self._offset
+    
+    def flush(self):
+        # Write everything queued so far and wait for it (e.g. before a
+        # checkpoint). Does not fsync.
+        if self._length:
+            self._submit()
+        self._full.join()
+        if self.error is not None:
+            raise self.error
+        self.file.flush()
+    
+    def close(self):
+        # Flush, stop the writer thread and apply the 'end' fsync. The file
+        # itself is left open for the caller.
+        if self.closed:
+            return
+        self.closed = True
+        
+        try:
+            self.flush()
+        finally:
+            self._full.put(None)
+            self._thread.join()
+        
+        if self.fsync != 'none':
+            self._sync()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            try:
+                self.close()
+            except Exception:
+                pass  # the original exception is more useful
+
+
+def write_range(out, converter, start, stop, batch_size, on_progress=None, stats=None, step=1):
+    # Write range(start, stop, step) to the binary file out, one write per
+    # batch_size numbers. Returns how many were written. With stats (a
+    # GenerationStats), the time spent converting and writing is recorded.
+    written = 0
+    clock = time.perf_counter
+    converted = clock()
+    
+    for count, data in converter.iter_stepped_batches(start, stop, step, batch_size):
+        began = clock()
+        out.write(data)
+        written += count
+        
+        if stats is not None:
+            finished = clock()
+            stats.record(count, len(data), began - converted, finished - began, data)
+            converted = finished
+        
+        if on_progress is not None:
+            on_progress(written)
+    
+    return written
+
+
+def write_range_pipelined(out, converter, start, stop, batch_size, buffers=3, fsync='none',
+                          drop_cache=False, stats=None, step=1):
+    # write_range through a PipelinedWriter: blocks are converted on this
+    # thread while the previous batches are written on another.
+    written = 0
+    
+    with PipelinedWriter(out, batch_size, buffers, fsync, drop_cache=drop_cache,
+                         stats=stats) as writer:
+        for count, block in converter.iter_stepped_batches(start, stop, step, 1):
+            writer.write(block, count)
+            written += count
+    
+    return written
+
+
+NUMBER_CHUNK_SIZE = 4 * 1024 * 1024
+# The separators bytes.split() cuts at, newline first since it is the usual one.
+NUMBER_SEPARATORS = (b'\n', b' ', b'\t', b'\r', b'\x0b', b'\x0c')
+
+
+def read_number_batches(f, chunk_size=NUMBER_CHUNK_SIZE):
+    # Yield the integers in the binary file f as lists, reading chunk_size
+    # bytes at a time, so memory stays bounded however large the input (by
+    # chunk_size plus the longest number). Numbers are separated by newlines
+    # or other whitespace and may be written any way parse_number accepts;
+    # an invalid one raises ValueError naming its line.
+    def parse_slowly(data, first_line):
+        values = []
+        for offset, text in enumerate(data.split(b'\n')):
+            for token in text.split():
+                try:
+                    values.append(parse_number(token.decode('utf-8')))
+                except ValueError:
+                    raise ValueError(f"line {first_line + offset:,}: not a number: "
+                                     f"{token[:40].decode('utf-8', 'replace')!r}") from None
+        return values
+    
+    tail = b''
+    line = 1
+    
+    while True:
+        data = f.read(chunk_size)
+        if data:
+            data = tail + data
+            # Cut after the last separator of any kind; each search only
+            # looks past the best cut found so far.
+            cut = 0
+            for separator in NUMBER_SEPARATORS:
+                cut = max(cut, data.rfind(separator, cut) + 1)
+            data, tail = data[:cut], data[cut:]
+        elif tail:
+            data, tail = tail, b''
+        else:
+            return
+        
+        try:
+            values = list(map(int, data.split()))
+        except ValueError:
+            values = parse_slowly(data, line)
+        line += data.count(b'\n')
+        
+        if values:
+            yield values
+
+
+def write_numbers(out, converter, batches, stats=None, should_stop=None):
+    # Write the words for each list of numbers from batches (for example
+    # read_number_batches) to the binary file out, in order, one line per
+    # number. Only one batch is held at a time. should_stop() is polled
+    # between batches. Returns how many numbers were written.
+    written = 0
+    clock = time.perf_counter
+    converted = clock()
+    
+    for values in batches:
+        if should_stop is not None and should_stop():
+            break
+        
+        data = converter.encode_many(values)
+        began = clock()
+        out.write(data)
+        written += len(values)
+        
+        if stats is not None:
+            finished = clock()
+            stats.record(len(values), len(data), began - converted, finished - began, data)
+            converted = finished
+    
+    return written
+
+
+class StderrProgress:
+    # Single-line progress report on stderr for the CLI, called with
+    # GenerationStats snapshots by a ProgressSampler.
+    
+    def __call__(self, snapshot):
+        total = snapshot['total']
+        done = snapshot['numbers']
+        rate = snapshot['rate'] if snapshot['final'] else snapshot['recent_rate']
+        count = f"{done:,}" if total is None else f"{done:,} / {total:,} ({snapshot['percent']:.1f}%)"
+        sys.stderr.write(f"\r{count} - {rate:,.0f} numbers/sec, "
+                         f"{snapshot['byte_rate'] / (1024 * 1024):,.1f} MB/s")
+        sys.stderr.flush()
+    
+    def finish(self):
+        sys.stderr.write('\n')
+
+
+class MetricsWriter:
+    # Appends each GenerationStats snapshot as one JSON line, for graphing
+    # or feeding into other monitoring.
+    
+    def __init__(self, path):
+        self.file = open(path, 'a', encoding='utf-8')
+    
+    def __call__(self, snapshot):
+        import json
+        
+        record = {key: value for key, value in snapshot.items() if key != 'block'}
+        record['time'] = time.time()
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
+
+
+def parse_number(text):
+    # Accept 1000000, 1,000,000 and 1_000_000, with any number of digits.
+    text = text.replace(',', '')
+    if len(text) > 3000:
+        digits = text.replace('_', '')
+        sign = -1 if digits.startswith('-') else 1
+        digits = digits.lstrip('+-')
+        if digits.isdigit():
+            return sign * int_from_digits(digits)
+    return int(text)
+
+
+def parse_size(text):
+    # Accept a byte count with an optional K, M or G suffix (powers of 1024).
+    text = text.strip().upper().rstrip('B')
+    multiplier = 1
+    if text and text[-1] in 'KMG':
+        multiplier = 1024 ** ('KMG'.index(text[-1]) + 1)
+        text = text[:-1]
+    return int(float(text.replace(',', '')) * multiplier)
+
+
+def build_parser():
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog='number_words.py',
+        description="Convert numbers to words and generate ranges without the GUI.")
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+    
+    convert = commands.add_parser('convert', help="print the words for each number")
+    convert.add_argument('numbers', nargs='+', type=parse_number, metavar='NUMBER')
+    
+    generate = commands.add_parser('generate', help="write START..END, one number per line")
+    generate.add_argument('start', type=parse_number, metavar='START')
+    generate.add_argument('end', type=parse_number, metavar='END')
+    generate.add_argument('-o', '--output', default='-',
+                          help="output file, or '-' for stdout (the default); a .gz, .bz2 "
+                               "or .xz name writes compressed frames plus a .idx index")
+    generate.add_argument('--step', type=parse_number, default=1,
+                          help="write every STEP-th number from START (default: 1)")
+    generate.add_argument('--batch-size', type=parse_number, default=100000,
+                          help="numbers per write, or per frame when compressing "
+                               "(default: 100,000)")
+    generate.add_argument('--workers', type=parse_number, default=1,
+                          help="worker processes, or compression threads (default: 1)")
+    generate.add_argument('--progress', action='store_true',
+                          help="report progress on stderr")
+    generate.add_argument('--sorted', action='store_true',
+                          help="write the lines in alphabetical (byte) order using an "
+                               "external merge sort; --workers sorts runs in parallel")
+    generate.add_argument('--memory', type=parse_size, default=SORT_MEMORY,
+                          help="memory budget for --sorted, e.g. 512M or 4G (default: 512M)")
+    generate.add_argument('--temp-dir', default=None,
+                          help="where --sorted spills its runs (default: next to the output, "
+                               "or the system temp directory)")
+    generate.add_argument('--pipeline', action='store_true',
+                          help="write on a separate thread while converting the next batches")
+    generate.add_argument('--buffers', type=parse_number, default=3,
+                          help="reusable buffers for --pipeline (default: 3)")
+    generate.add_argument('--fsync', choices=FSYNC_POLICIES, default='none',
+                          help="when --pipeline syncs the output file to disk (default: none)")
+    generate.add_argument('--drop-cache', action='store_true',
+                          help="with --pipeline and --fsync, drop written pages from the page cache")
+    generate.add_argument('--metrics', metavar='FILE',
+                          help="append progress counters to FILE as JSON lines")
+    generate.add_argument('--interval', type=float, default=0.5,
+                          help="seconds between progress samples (default: 0.5)")
+    
+    stream = commands.add_parser('stream', help="convert numbers read from a file or stdin, "
+                                                "one per line, in order")
+    stream.add_argument('input', nargs='?', default='-',
+                        help="file of numbers, or '-' for stdin (the default)")
+    stream.add_argument('-o', '--output', default='-',
+                        help="output file, or '-' for stdout (the default)")
+    stream.add_argument('--chunk-size', type=parse_size, default=NUMBER_CHUNK_SIZE,
+                        help="bytes of input read at a time (default: 4M)")
+    stream.add_argument('--progress', action='store_true',
+                        help="report progress on stderr")
+    stream.add_argument('--metrics', metavar='FILE',
+                        help="append progress counters to FILE as JSON lines")
+    stream.add_argument('--interval', type=float, default=0.5,
+                        help="seconds between progress samples (default: 0.5)")
+    
+    parse = commands.add_parser('parse', help="turn lines of words back into numbers")
+    parse.add_argument('input', nargs='?', default='-',
+                       help="file to parse, or '-' for stdin (the default)")
+    parse.add_argument('-q', '--quiet', action='store_true',
+                       help="only validate; do not print the numbers")
+    
+    stats = commands.add_parser('stats', help="word, letter and line-length statistics "
+                                              "for START..END without generating it")
+    stats.add_argument('start', type=parse_number, metavar='START')
+    stats.add_argument('end', type=parse_number, metavar='END')
+    stats.add_argument('--json', action='store_true', help="print the full result as JSON")
+    
+    serve = commands.add_parser('serve', help="run a local HTTP conversion service "
+                                              "(see number_words_server.py)")
+    serve.add_argument('--host', default='127.0.0.1',
+                       help="address to listen on (default: 127.0.0.1)")
+    serve.add_argument('--port', type=int, default=8000,
+                       help="TCP port, or 0 to pick a free one (default: 8000)")
+    serve.add_argument('--socket', metavar='PATH', default=None,
+                       help="listen on a Unix socket instead of a TCP port")
+    serve.add_argument('--workers', type=parse_number, default=1,
+                       help="worker processes for large batches and ranges (default: 1)")
+    serve.add_argument('--verbose', action='store_true', help="log every request on stderr")
+    
+    verify = commands.add_parser('verify', help="check a generated file line by line")
+    verify.add_argument('input', metavar='FILE')
+    verify.add_argument('--start', type=parse_number, default=1,
+                        help="number on the first line (default: 1)")
+    verify.add_argument('--end', type=parse_number, default=None,
+                        help="number expected on the last line (default: from the file size)")
+    verify.add_argument('--workers', type=parse_number, default=1,
+                        help="worker processes (default: 1)")
+    
+    return parser
+
+
+def run_stats(args):
+    # Print range_stats for args.start..args.end.
+    result = NumberToWords().range_stats(args.start, args.end)
+    
+    if args.json:
+        import json
+        
+        print(json.dumps(result, indent=2))
+        return 0
+    
+    longest, shortest = result['longest'], result['shortest']
+    print(f"Lines:    {result['lines']:,}\n"
+          f"Bytes:    {result['bytes']:,}\n"
+          f"Words:    {result['words']:,}\n"
+          f"Longest:  {longest[0]:,} characters ({longest[1]:,})\n"
+          f"Shortest: {shortest[0]:,} characters ({shortest[1]:,})\n"
+          f"\nMost common words:")
+    for word, count in list(result['word_counts'].items())[:10]:
+        print(f"  {word:<12} {count:>30,}")
+    print("\nLetters:")
+    for letter, count in result['letter_counts'].items():
+        print(f"  {letter} {count:>30,}")
+    return 0
+
+
+def run_verify(args):
+    # Verify a generated file and print the result.
+    result = verify_file(args.input, args.start, args.end, args.workers)
+    rate = result['size'] / result['elapsed'] / (1024 * 1024) if result['elapsed'] > 0 else 0
+    
+    if result['ok']:
+        print(f"OK: {result['lines']:,} lines ({result['start']:,}..{result['end']:,}), "
+              f"{result['size']:,} bytes in {result['elapsed']:.2f}s ({rate:,.0f} MB/s)")
+        return 0
+    
+    mismatch = result['mismatch']
+    print(f"MISMATCH at line for {mismatch['number']:,} (byte offset {mismatch['offset']:,}) "
+          f"after {result['lines']:,} good lines\n"
+          f"  expected: {mismatch['expected']!r}\n"
+          f"  found:    {mismatch['found']!r}")
+    return 1
+
+
+def run_parse(args):
+    # Parse a generated file (or stdin) back into numbers and report the
+    # throughput on stderr.
+    converter = NumberToWords()
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    start = time.time()
+    count = 0
+    
+    try:
+        if args.quiet:
+            for _ in converter.parse_lines(source):
+                count += 1
+        else:
+            write = sys.stdout.write
+            for num in converter.parse_lines(source):
+                write(f"{num}\n")
+                count += 1
+    except ValueError as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    
+    elapsed = time.time() - start
+    rate = count / elapsed if elapsed > 0 else 0
+    sys.stderr.write(f"Parsed {count:,} lines in {elapsed:.2f}s ({rate:,.0f} lines/sec)\n")
+    return 0
+
+
+def run_generate(args):
+    # Generate args.start..args.end to a file or stdout.
+    stats = GenerationStats(args.start, args.end, args.step)
+    run_with_progress(args, stats, lambda: generate_output(args, stats))
+    return 0
+
+
+def run_stream(args):
+    # Convert the numbers in args.input to a file or stdout.
+    stats = GenerationStats(None)
+    source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    out = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    
+    try:
+        run_with_progress(args, stats, lambda: write_numbers(
+            out, NumberToWords(), read_number_batches(source, args.chunk_size), stats))
+    except ValueError as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if out is sys.stdout.buffer:
+            out.flush()
+        else:
+            out.close()
+    
+    return 0
+
+
+def run_with_progress(args, stats, work):
+    # Call work() while sampling stats for --progress and --metrics on a
+    # background thread, and return its result.
+    reporters = []
+    if args.progress:
+        reporters.append(StderrProgress())
+    if args.metrics:
+        reporters.append(MetricsWriter(args.metrics))
+    
+    sampler = None
+    if reporters:
+        sampler = ProgressSampler(stats, lambda snapshot: [report(snapshot) for report in reporters],
+                                  args.interval).start()
+    
+    try:
+        return work()
+    finally:
+        if sampler:
+            sampler.stop()
+        for reporter in reporters:
+            if isinstance(reporter, StderrProgress):
+                reporter.finish()
+            else:
+                reporter.close()
+
+
+def generate_output(args, stats):
+    # The work behind run_generate; progress goes into stats.
+    converter = NumberToWords()
+    stop = args.end + 1
+    to_stdout = args.output == '-'
+    
+    def on_progress(done):
+        stats.set_totals(done, converter.output_size(args.start, args.start + done - 1))
+    
+    codec = None if to_stdout else codec_for_path(args.output)
+    if codec:
+        # Compressed, framed and indexed; --workers sets the compression threads.
+        write_compressed(args.output, args.start, stop, codec, frame_size=args.batch_size,
+                         workers=args.workers, on_progress=on_progress)
+        return
+    
+    out = sys.stdout.buffer if to_stdout else open(args.output, 'wb')
+    try:
+        if not to_stdout and args.step == 1:
+            preallocate(out, converter.output_size(args.start, args.end))
+        
+        if args.sorted:
+            temp_dir = args.temp_dir or (None if to_stdout else
+                                         os.path.dirname(os.path.abspath(args.output)))
+            write_sorted(out, args.start, stop, args.memory, args.workers, temp_dir,
+                         on_progress=on_progress)
+        elif args.workers > 1:
+            import tempfile
+            
+            part_dir = tempfile.mkdtemp() if to_stdout else None
+            part_prefix = os.path.join(part_dir, 'shard') if part_dir else args.output
+            try:
+                generate_sharded(out, args.start, stop, args.workers, part_prefix,
+                                 args.batch_size, on_progress=on_progress)
+            finally:
+                if part_dir:
+                    os.rmdir(part_dir)
+        elif args.pipeline:
+            write_range_pipelined(out, converter, args.start, stop, args.batch_size,
+                                  args.buffers, args.fsync, args.drop_cache, stats, args.step)
+        else:
+            write_range(out, converter, args.start, stop, args.batch_size, stats=stats,
+                        step=args.step)
+        
+        if to_stdout:
+            out.flush()
+        else:
+            out.truncate()
+    finally:
+        if not to_stdout:
+            out.close()
+
+
+def run_piped(run, args):
+    # run(args) for a command that writes to stdout.
+    try:
+        return run(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+
+def main(argv=None):
+    # Command-line entry point. Deliberately imports nothing from tkinter.
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.command == 'convert':
+        # Written a group at a time, so huge numbers stream out.
+        converter = NumberToWords()
+        write = sys.stdout.write
+        for num in args.numbers:
+            words = converter.iter_words(num)
+            write(next(words))
+            for group in words:
+                write(' ' + group)
+            write('\n')
+        return 0
+    
+    if args.command == 'parse':
+        return run_parse(args)
+    
+    if args.command == 'stats':
+        if args.start > args.end:
+            parser.error("START must not be greater than END")
+        return run_stats(args)
+    
+    if args.command == 'serve':
+        if args.workers < 1:
+            parser.error("--workers must be positive")
+        from number_words_server import serve
+        
+        try:
+            return serve(args.host, args.port, args.socket, args.workers, args.verbose)
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+    
+    if args.command == 'verify':
+        if args.workers < 1:
+            parser.error("--workers must be positive")
+        return run_verify(args)
+    
+    # Both report progress every --interval seconds; 0 or less would spin.
+    if args.command in ('generate', 'stream') and not 0 < args.interval < float('inf'):
+        parser.error("--interval must be a positive number of seconds")
+    
+    if args.command == 'stream':
+        if args.chunk_size < 1:
+            parser.error("--chunk-size must be positive")
+        return run_piped(run_stream, args)
+    
+    if args.start > args.end:
+        parser.error("START must not be greater than END")
+    if args.batch_size < 1 or args.workers < 1 or args.buffers < 1 or args.step < 1:
+        parser.error("--batch-size, --workers, --buffers and --step must be positive")
+    if args.step > 1 and (args.sorted or args.workers > 1 or codec_for_path(args.output)):
+        parser.error("--step needs a single worker, unsorted and uncompressed output")
+    if (args.fsync != 'none' or args.drop_cache) and not args.pipeline:
+        parser.error("--fsync and --drop-cache need --pipeline")
+    if args.sorted and (args.pipeline or codec_for_path(args.output)):
+        parser.error("--sorted cannot be combined with --pipeline or compressed output")
+    if args.sorted and args.memory < SORT_MEMORY_MIN:
+        parser.error(f"--memory must be at least {SORT_MEMORY_MIN // (1024 * 1024)}M")
+    if args.pipeline and (args.workers > 1 or codec_for_path(args.output)):
+        parser.error("--pipeline needs a single worker and uncompressed output")
+    if args.fsync != 'none' and args.output == '-':
+        parser.error("--fsync needs an output file")
+    if args.drop_cache and args.fsync == 'none':
+        parser.error("--drop-cache needs an --fsync policy")
+    
+    return run_piped(run_generate, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Asyncio front end for the Number to Words engine #
+#
+# Conversion is CPU-bound, so these helpers work in bounded batches and hand
+# control back to the event loop between them; file writes run in the loop's
+# default executor. Kept out of number_words.py so the command line does not
+# pay for importing asyncio.
+
+import asyncio
+
+from number_words import NumberToWords
+
+
+async def aiter_range(start, stop, batch_size=10000, converter=None):
+    # Async generator yielding the words for range(start, stop) as lists of at
+    # least batch_size strings (the last may be shorter), yielding control to
+    # the event loop after every batch.
+    converter = converter or NumberToWords()
+    batch = []
+    
+    for block in converter.iter_blocks(start, stop):
+        batch.extend(block)
+        
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+            await asyncio.sleep(0)
+    
+    if batch:
+        yield batch
+
+
+async def aconvert_many(numbers, batch_size=10000, converter=None):
+    # Convert an iterable of numbers, yielding to the event loop every
+    # batch_size conversions. Returns the list of words.
+    converter = converter or NumberToWords()
+    convert = converter.convert
+    result = []
+    
+    for i, num in enumerate(numbers, 1):
+        result.append(convert(num))
+        if i % batch_size == 0:
+            await asyncio.sleep(0)
+    
+    return result
+
+
+async def agenerate_file(path, start, stop, batch_size=10000, converter=None, on_progress=None):
+    # Write range(start, stop) to path, one number per line. Each batch is
+    # built on the event loop and written in the default executor while the
+    # next one is built. Returns how many numbers were written.
+    #
+    # On cancellation the write in flight is allowed to finish and the file is
+    # flushed and closed before CancelledError propagates, so the file always
+    # holds a contiguous run of lines from start.
+    converter = converter or NumberToWords()
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, 'wb')
+    
+    written = 0
+    pending = None
+    pending_count = 0
+    
+    try:
+        for count, data in converter.iter_byte_batches(start, stop, batch_size):
+            if pending is not None:
+                # shield: cancelling us must not abandon a write mid-way
+                await asyncio.shield(pending)
+                pending = None
+                written += pending_count
+                if on_progress is not None:
+                    on_progress(written)
+            
+            pending = loop.run_in_executor(None, f.write, data)
+            pending_count = count
+            await asyncio.sleep(0)
+        
+        if pending is not None:
+            await asyncio.shield(pending)
+            pending = None
+            written += pending_count
+            if on_progress is not None:
+                on_progress(written)
+    
+    finally:
+        try:
+            if pending is not None:
+                # A write still in flight (after a cancellation) is let finish.
+                # One that failed has raised already; wait() does not raise it
+                # again, so the file is closed either way.
+                await asyncio.wait([pending])
+        finally:
+            await loop.run_in_executor(None, f.close)
+    
+    return written
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+# Local conversion service for the Number to Words engine #
+#
+# A long-running HTTP server on a local TCP port or a Unix socket, so other
+# programs can convert numbers without starting a Python process per call:
+#
+#   python number_words.py serve --port 8080 --workers 4
+#   curl -d '[1, 22, "1,000,000"]' http://127.0.0.1:8080/convert
+#   curl 'http://127.0.0.1:8080/range?start=1&end=1000000' > numbers.txt
+#   curl --unix-socket /tmp/words.sock http://localhost/stats
+#
+# Endpoints:
+#   POST /convert  A JSON body (a number, a list of numbers or {"numbers": [...]})
+#                  is answered with {"words": [...]}. An application/x-ndjson or
+#                  text/plain body holds one number per line and is answered line
+#                  for line, as JSON strings or plain words, in a chunked response
+#                  written while the body is still being read. Numbers may be
+#                  given as strings ("1,000,000"), which is the only way past the
+#                  4,300 digits Python's JSON parser accepts.
+#   GET  /range    ?start=A&end=B streams the words for A..B inclusive as text,
+#                  one per line, in a chunked response.
+#   GET  /stats    Request counts, throughput and latency percentiles per
+#                  endpoint; ?reset=1 starts a new measurement window.
+#
+# Batches and ranges of at least POOL_THRESHOLD numbers are split across a
+# process pool when there is more than one worker; smaller ones are converted
+# on the request thread.
+
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from number_words import NumberToWords, parse_number
+
+MAX_BODY = 64 * 1024 * 1024
+POOL_THRESHOLD = 20000
+POOL_CHUNK = 10000
+RANGE_CHUNK = 50000
+STREAM_BATCH = 10000
+LATENCY_SAMPLES = 10000
+
+_worker_converter = None
+
+
+def init_worker():
+    # Process pool initializer: one converter per worker.
+    global _worker_converter
+    _worker_converter = NumberToWords()
+
+
+def convert_chunk(values):
+    # Pool task: the words for a list of numbers.
+    convert = _worker_converter.convert
+    return [convert(num) for num in values]
+
+
+def range_chunk(start, stop):
+    # Pool task: range(start, stop) as newline-terminated UTF-8 lines.
+    return b''.join(_worker_converter.iter_byte_blocks(start, stop))
+
+
+def parse_value(value):
+    # A number from a JSON value: an integer, or a string parse_number accepts.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return parse_number(value.strip())
+    raise TypeError(f"not a number: {value!r}")
+
+
+def percentile(ordered, fraction):
+    # Nearest-rank percentile of an already sorted list.
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(fraction * len(ordered) + 0.999999) - 1))
+    return ordered[index]
+
+
+def latency_summary(latencies):
+    # Mean, p50, p90, p99 and max of a list of latencies in seconds, in ms.
+    ordered = sorted(latencies)
+    mean = sum(ordered) / len(ordered) if ordered else 0.0
+    return {'mean': mean * 1000,
+            'p50': percentile(ordered, 0.50) * 1000,
+            'p90': percentile(ordered, 0.90) * 1000,
+            'p99': percentile(ordered, 0.99) * 1000,
+            'max': (ordered[-1] if ordered else 0.0) * 1000}
+
+
+class ServiceStats:
+    # Counters and a window of recent latencies per endpoint, updated by
+    # the handler threads under a lock.
+    
+    def __init__(self, window=LATENCY_SAMPLES):
+        self.window = window
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self.lock:
+            self.started = time.perf_counter()
+            self.routes = {}
+    
+    def record(self, route, seconds, numbers=0, size=0, error=False):
+        from collections import deque
+        
+        with self.lock:
+            entry = self.routes.get(route)
+            if entry is None:
+                entry = self.routes[route] = {'requests': 0, 'errors': 0, 'numbers': 0,
+                                              'bytes': 0, 'latencies': deque(maxlen=self.window)}
+            entry['requests'] += 1
+            entry['errors'] += bool(error)
+            entry['numbers'] += numbers
+            entry['bytes'] += size
+            entry['latencies'].append(seconds)
+    
+    def snapshot(self):
+        # Totals and rates since the last reset, plus latency percentiles in
+        # milliseconds over the last `window` requests of each endpoint.
+        with self.lock:
+            elapsed = time.perf_counter() - self.started
+            routes = {route: dict(entry, latencies=list(entry['latencies']))
+                      for route, entry in self.routes.items()}
+        
+        totals = {key: sum(entry[key] for entry in routes.values())
+                  for key in ('requests', 'errors', 'numbers', 'bytes')}
+        rate = (lambda value: value / elapsed if elapsed > 0 else 0.0)
+        
+        return {'elapsed': elapsed,
+                **totals,
+                'requests_per_second': rate(totals['requests']),
+                'numbers_per_second': rate(totals['numbers']),
+                'bytes_per_second': rate(totals['bytes']),
+                'routes': {route: {'requests': entry['requests'],
+                                   'errors': entry['errors'],
+                                   'numbers': entry['numbers'],
+                                   'bytes': entry['bytes'],
+                                   'latency_ms': latency_summary(entry['latencies'])}
+                           for route, entry in sorted(routes.items())}}
+
+
+class ConversionService:
+    # The work behind the HTTP handler: one converter shared by the request
+    # threads, and an optional process pool for large batches.
+    
+    def __init__(self, workers=1, pool_threshold=POOL_THRESHOLD):
+        self.workers = workers
+        self.pool_threshold = pool_threshold
+        self.stats = ServiceStats()
+        self.converter = NumberToWords()
+        self.pool = None
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+    
+    def convert(self, values):
+        # The words for a list of numbers, in order.
+        if self.pool is None or len(values) < self.pool_threshold:
+            convert = self.converter.convert
+            return [convert(num) for num in values]
+        
+        chunks = [values[i:i + POOL_CHUNK] for i in range(0, len(values), POOL_CHUNK)]
+        words = []
+        for chunk_words in self.pool.map(convert_chunk, chunks):
+            words.extend(chunk_words)
+        return words
+    
+    def iter_range(self, start, stop):
+        # Yield range(start, stop) as (count, bytes) chunks of about
+        # RANGE_CHUNK lines, in order. With a pool, at most two chunks per
+        # worker are converted ahead of the one being sent, so memory stays
+        # bounded however long the range or slow the client.
+        if self.pool is None or stop - start < self.pool_threshold:
+            yield from self.converter.iter_byte_batches(start, stop, RANGE_CHUNK)
+            return
+        
+        from collections import deque
+        
+        pending = deque()
+        position = start
+        try:
+            while position < stop or pending:
+                while position < stop and len(pending) < 2 * self.workers:
+                    end = min(stop, position + RANGE_CHUNK)
+                    pending.append((end - position, self.pool.submit(range_chunk, position, end)))
+                    position = end
+                
+                count, future = pending.popleft()
+                yield count, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    # Routes requests to self.server.service. Speaks HTTP/1.1 so clients can
+    # keep a connection open across requests; streamed responses use chunked
+    # transfer encoding (or close the connection for HTTP/1.0 clients).
+    
+    protocol_version = 'HTTP/1.1'
+    server_version = 'NumberWords/1.0'
+    
+    def setup(self):
+        # Headers and body go out in separate writes; without TCP_NODELAY a
+        # small response waits for the client's delayed ACK (about 40 ms).
+        self.disable_nagle_algorithm = not isinstance(self.server, UnixHTTPServer)
+        super().setup()
+    
+    def do_GET(self):
+        self.dispatch()
+    
+    def do_POST(self):
+        self.dispatch()
+    
+    def dispatch(self):
+        from urllib.parse import parse_qs, urlsplit
+        
+        url = urlsplit(self.path)
+        routes = {'/convert': ('POST', self.handle_convert),
+                  '/range': ('GET', self.handle_range),
+                  '/stats': ('GET', self.handle_stats)}
+        self.status = 200
+        self.numbers = 0
+        self.sent = 0
+        started = time.perf_counter()
+        
+        try:
+            if url.path not in routes:
+                self.send_error_json(404, f"no such endpoint: {url.path}")
+            elif routes[url.path][0] != self.command:
+                self.send_error_json(405, f"{url.path} expects {routes[url.path][0]}")
+            else:
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                routes[url.path][1](query)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away mid-response.
+            self.status = 499
+            self.close_connection = True
+        
+        if url.path != '/stats':
+            self.server.service.stats.record(url.path if url.path in routes else 'other',
+                                             time.perf_counter() - started, self.numbers,
+                                             self.sent, self.status >= 400)
+    
+    def handle_convert(self, query):
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self.send_error_json(411, "a Content-Length header is required")
+            return
+        # Only plain decimal digits: int() would also take signs, spaces and
+        # underscores, and a negative length would read to the end of input.
+        if not (length.isascii() and length.isdigit()):
+            self.send_error_json(400, f"invalid Content-Length {length!r}")
+            self.close_connection = True  # the body's extent is unknown
+            return
+        length = int(length)
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip()
+        
+        if content_type in ('application/x-ndjson', 'text/plain'):
+            self.stream_convert(length, ndjson=content_type == 'application/x-ndjson')
+            return
+        
+        if length > MAX_BODY:
+            self.send_error_json(413, f"body larger than {MAX_BODY:,} bytes; "
+                                      "send newline-delimited numbers instead")
+            self.close_connection = True
+            return
+        
+        try:
+            payload = json.loads(self.rfile.read(length))
+            if isinstance(payload, dict):
+                payload = payload.get('numbers')
+                if not isinstance(payload, list):
+                    raise TypeError("expected {\"numbers\": [...]}")
+            values = [parse_value(value) for value in payload] if isinstance(payload, list) \
+                else [parse_value(payload)]
+        except (ValueError, TypeError) as e:
+            self.send_error_json(400, str(e))
+            return
+        
+        self.numbers = len(values)
+        self.send_json(200, {'words': self.server.service.convert(values)})
+    
+    def stream_convert(self, length, ndjson):
+        # Convert newline-delimited numbers STREAM_BATCH lines at a time,
+        # sending each batch of words before reading the next. An invalid line
+        # ends the response with an error line: {"error": ..., "line": n} for
+        # NDJSON, "error: line n: ..." for text.
+        service = self.server.service
+        remaining = length
+        line_number = 0
+        
+        self.start_stream('application/x-ndjson' if ndjson else 'text/plain; charset=utf-8')
+        
+        while remaining > 0:
+            values = []
+            error = None
+            
+            while remaining > 0 and len(values) < STREAM_BATCH:
+                line, size = self.read_line(remaining)
+                if not size:
+                    remaining = 0
+                    break
+                remaining -= size
+                line_number += 1
+                if line is None:
+                    error = f"line longer than {MAX_BODY:,} bytes"
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    values.append(parse_value(json.loads(line)) if ndjson
+                                  else parse_number(line.decode('utf-8')))
+                except (ValueError, TypeError) as e:
+                    error = str(e)
+                    break
+            
+            words = service.convert(values)
+            self.numbers += len(words)
+            if ndjson:
+                self.write_stream(''.join(json.dumps(w) + '\n' for w in words).encode('utf-8'))
+            elif words:
+                self.write_stream(('\n'.join(words) + '\n').encode('utf-8'))
+            
+            if error is not None:
+                self.status = 400
+                if ndjson:
+                    message = json.dumps({'error': error, 'line': line_number}) + '\n'
+                else:
+                    message = f"error: line {line_number}: {error}\n"
+                self.write_stream(message.encode('utf-8'))
+                # The rest of the body is unread, so the connection cannot be reused.
+                self.close_connection = True
+                break
+        
+        self.end_stream()
+    
+    def read_line(self, remaining):
+        # Read one line of the body, at most `remaining` bytes, in 1 MiB
+        # pieces so a number of any length arrives whole. Returns (line,
+        # bytes read); line is None for a line over MAX_BODY, whose rest is
+        # left unread.
+        parts = []
+        size = 0
+        while size < remaining:
+            part = self.rfile.readline(min(remaining - size, 1 << 20))
+            if not part:
+                break
+            parts.append(part)
+            size += len(part)
+            if part.endswith(b'\n'):
+                break
+            if size > MAX_BODY:
+                return None, size
+        return b''.join(parts), size
+    
+    def handle_range(self, query):
+        try:
+            start = parse_number(query.get('start', '1'))
+            end = parse_number(query['end'])
+        except KeyError:
+            self.send_error_json(400, "end is required")
+            return
+        except ValueError as e:
+            self.send_error_json(400, str(e))
+            return
+        if start > end:
+            self.send_error_json(400, "start must not be greater than end")
+            return
+        
+        self.start_stream('text/plain; charset=utf-8')
+        for count, data in self.server.service.iter_range(start, end + 1):
+            self.write_stream(data)
+            self.numbers += count
+        self.end_stream()
+    
+    def handle_stats(self, query):
+        stats = self.server.service.stats
+        snapshot = stats.snapshot()
+        snapshot['workers'] = self.server.service.workers
+        if query.get('reset') in ('1', 'true', 'yes'):
+            stats.reset()
+        self.send_json(200, snapshot)
+    
+    def send_json(self, status, payload):
+        body = (json.dumps(payload) + '\n').encode('utf-8')
+        self.status = status
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.sent += len(body)
+    
+    def send_error_json(self, status, message):
+        self.send_json(status, {'error': message})
+    
+    def start_stream(self, content_type):
+        self.chunked = self.request_version != 'HTTP/1.0'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if self.chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.close_connection = True
+        self.end_headers()
+    
+    def write_stream(self, data):
+        if not data:
+            return
+        if self.chunked:
+            self.wfile.write(b'%X\r\n' % len(data))
+            self.wfile.write(data)
+            self.wfile.write(b'\r\n')
+        else:
+            self.wfile.write(data)
+        self.sent += len(data)
+    
+    def end_stream(self):
+        if self.chunked:
+            self.wfile.write(b'0\r\n\r\n')
+    
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    # ThreadingHTTPServer's counterpart on a Unix socket. Clients have no
+    # address there, so a placeholder keeps the request logging working.
+    
+    daemon_threads = True
+    
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('local', 0)
+
+
+def make_server(service, host='127.0.0.1', port=8000, socket_path=None, verbose=False):
+    # An HTTP server for service on host:port, or on socket_path when given.
+    # A stale socket file left by an earlier run is replaced, but not one a
+    # running server still answers on.
+    if socket_path:
+        import socket
+        import stat
+        
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                raise ValueError(f"{socket_path} exists and is not a socket")
+            with socket.socket(socket.AF_UNIX) as probe:
+                try:
+                    probe.connect(socket_path)
+                except OSError:
+                    os.remove(socket_path)
+                else:
+                    raise ValueError(f"{socket_path} is in use by another server")
+        server = UnixHTTPServer(socket_path, ConversionHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ConversionHandler)
+    
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def serve(host='127.0.0.1', port=8000, socket_path=None, workers=1, verbose=False):
+    # Run the service until interrupted (Ctrl+C or SIGTERM). The address is
+    # announced on stderr; with port 0 it shows the port that was picked.
+    import signal
+    
+    service = ConversionService(workers)
+    server = make_server(service, host, port, socket_path, verbose)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    if socket_path:
+        address = f"unix:{socket_path}"
+    else:
+        address = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    sys.stderr.write(f"Serving on {address} with {workers} worker(s)\n")
+    sys.stderr.flush()
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+    
+    return 0
@@ -0,0 +1,84 @@
+# agenerate_file writes contiguous lines and always closes its file.
+
+import asyncio
+import errno
+import io
+
+import pytest
+
+import number_words_async
+from number_words import NumberToWords
+from number_words_async import agenerate_file, aiter_range
+
+
+class FailingFile(io.BytesIO):
+    # Accepts `limit` writes, then fails like a full disk.
+    
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+        self.closed_calls = 0
+    
+    def write(self, data):
+        if self.limit == 0:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        self.limit -= 1
+        return super().write(data)
+    
+    def close(self):
+        self.closed_calls += 1
+        super().close()
+
+
+def test_generate_file(tmp_path):
+    path = tmp_path / 'out.txt'
+    progress = []
+    
+    written = asyncio.run(agenerate_file(str(path), 1, 25001, 1000, on_progress=progress.append))
+    
+    assert written == 25000
+    assert progress[-1] == 25000
+    assert path.read_bytes() == NumberToWords().encode_many(range(1, 25001))
+
+
+@pytest.mark.parametrize('limit', [0, 1, 3])
+def test_failed_write_closes_file(monkeypatch, limit):
+    f = FailingFile(limit)
+    monkeypatch.setattr(number_words_async, 'open', lambda *args: f, raising=False)
+    
+    with pytest.raises(OSError) as raised:
+        asyncio.run(agenerate_file('unused', 1, 50001, 1000))
+    
+    assert raised.value.errno == errno.ENOSPC
+    assert f.closed_calls == 1
+
+
+def test_cancel_leaves_contiguous_lines(tmp_path):
+    path = tmp_path / 'out.txt'
+    
+    async def cancel_after_progress():
+        seen = asyncio.Event()
+        task = asyncio.create_task(agenerate_file(str(path), 1, 10 ** 7, 1000,
+                                                  on_progress=lambda done: seen.set()))
+        await seen.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    asyncio.run(cancel_after_progress())
+    
+    data = path.read_bytes()
+    count = data.count(b'\n')
+    assert 0 < count < 10 ** 7
+    assert data == NumberToWords().encode_many(range(1, count + 1))
+
+
+def test_aiter_range():
+    async def collect():
+        return [batch async for batch in aiter_range(1, 5001, 1000)]
+    
+    batches = asyncio.run(collect())
+    convert = NumberToWords().convert
+    
+    assert all(len(batch) >= 1000 for batch in batches[:-1])
+    assert [w for batch in batches for w in batch] == [convert(n) for n in range(1, 5001)]
@@ -0,0 +1,52 @@
+# MemoizedConverter returns what convert returns and counts its traffic.
+
+import threading
+
+import pytest
+
+from number_words import MemoizedConverter, NumberToWords
+
+
+def test_counters():
+    cache = NumberToWords().memoized(maxsize=3)
+    
+    for num in (1, 2, 1, 3, 4, 1, 5):
+        assert cache.convert(num) == NumberToWords().convert(num)
+    
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (2, 5, 3)
+    assert stats['evictions'] == 2
+    assert stats['hit_rate'] == pytest.approx(2 / 7)
+    
+    cache.clear()
+    assert cache.stats()['size'] == 0
+
+
+def test_shared_between_threads():
+    converter = NumberToWords()
+    cache = MemoizedConverter(converter, maxsize=100)
+    errors = []
+    
+    def work(seed):
+        for num in range(seed, seed + 5000):
+            value = num % 300 * 10 ** 20 + 17
+            if cache.convert(value) != converter.convert(value):
+                errors.append(value)
+    
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    stats = cache.stats()
+    assert errors == []
+    assert stats['hits'] + stats['misses'] == 8 * 5000
+    assert stats['size'] <= 100
+    # Only an estimate when threads share the cache (see MemoizedConverter).
+    assert stats['evictions'] >= 0
+
+
+def test_rejects_empty_cache():
+    with pytest.raises(ValueError):
+        MemoizedConverter(maxsize=0)
@@ -0,0 +1,56 @@
+# write_compressed and CompressedWordsReader: every codec reads back the
+# same lines, from any frame, and the file is still a normal compressed file.
+
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from number_words import CompressedWordsReader, NumberToWords, write_compressed
+
+OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+START, STOP = 990, 40010
+
+
+@pytest.mark.parametrize('extension', sorted(OPENERS))
+@pytest.mark.parametrize('workers', [1, 3])
+def test_round_trip(tmp_path, extension, workers):
+    converter = NumberToWords()
+    path = str(tmp_path / f'out.txt{extension}')
+    codec = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}[extension]
+    
+    written = write_compressed(path, START, STOP, codec, frame_size=3000, workers=workers)
+    
+    assert written == STOP - START
+    with OPENERS[extension](path, 'rb') as f:
+        assert f.read() == converter.encode_many(range(START, STOP))
+    
+    with CompressedWordsReader(path) as reader:
+        assert len(reader.frames) > 1
+        assert reader.lines(START, STOP) == [converter.convert(n) for n in range(START, STOP)]
+        for num in (START, 2999, 3990, 3991, 20000, STOP - 1):
+            assert reader.lookup(num) == converter.convert(num)
+        # Ranges that start and end inside frames, and cross several.
+        assert reader.lines(5000, 12345) == [converter.convert(n) for n in range(5000, 12345)]
+        
+        with pytest.raises(IndexError):
+            reader.lookup(START - 1)
+        with pytest.raises(IndexError):
+            reader.lines(STOP - 5, STOP + 1)
+
+
+def test_stop_keeps_whole_frames(tmp_path):
+    converter = NumberToWords()
+    path = str(tmp_path / 'out.txt.gz')
+    polls = iter(range(100))
+    
+    written = write_compressed(path, 1, 100001, 'gzip', frame_size=1000, workers=1,
+                               should_stop=lambda: next(polls) >= 5)
+    
+    assert 0 < written < 100000
+    with gzip.open(path, 'rb') as f:
+        assert f.read() == converter.encode_many(range(1, written + 1))
+    with CompressedWordsReader(path) as reader:
+        assert reader.end == written
+        assert reader.lookup(written) == converter.convert(written)
@@ -0,0 +1,29 @@
+# convert_many (NumPy) agrees with convert, including at the edges.
+
+import pytest
+
+from number_words import NumberToWords
+
+np = pytest.importorskip('numpy')
+
+
+def test_matches_convert():
+    converter = NumberToWords()
+    values = [0, 1, -1, 999, 1000, 10 ** 18, -2 ** 63, 2 ** 63 - 1, 2 ** 64 - 1, 10 ** 30]
+    
+    assert list(converter.convert_many(values)) == [converter.convert(v) for v in values]
+    assert list(converter.convert_many(np.array(values[:8], dtype=np.int64))) == \
+        [converter.convert(v) for v in values[:8]]
+
+
+@pytest.mark.parametrize('values', [[], np.array([], dtype=np.int64), np.zeros((0, 3), dtype=np.uint32)])
+def test_empty(values):
+    result = NumberToWords().convert_many(values)
+    
+    assert result.dtype == object
+    assert result.shape == np.asarray(values).shape
+
+
+def test_rejects_floats():
+    with pytest.raises(TypeError):
+        NumberToWords().convert_many([1.5])
@@ -0,0 +1,74 @@
+# parse and parse_lines invert convert exactly and reject everything else.
+
+import random
+
+import pytest
+
+from number_words import NumberToWords, int_from_digits
+
+
+@pytest.fixture(scope='module')
+def converter():
+    return NumberToWords()
+
+
+def sample_numbers():
+    rng = random.Random(3)
+    values = [0, 1, 9, 10, 11, 19, 20, 21, 99, 100, 101, 110, 999, 1000, 1001, 10 ** 6,
+              10 ** 21 - 1, 10 ** 21, 10 ** 21 + 1, 1000 ** 7 * 999 + 5]
+    values += [rng.randrange(10 ** digits) for digits in range(1, 80) for _ in range(5)]
+    # Scales past the built-in tables, and whole groups of zeros between them.
+    values += [10 ** 300, 10 ** 303 + 7, 1000 ** 120 * 42 + 1000 ** 3, 1000 ** 1001]
+    return values + [-v for v in values if v]
+
+
+@pytest.mark.parametrize('num', sample_numbers())
+def test_round_trip(converter, num):
+    assert converter.parse(converter.convert(num)) == num
+
+
+def test_round_trip_huge(converter):
+    num = int_from_digits('9081726354' * 500)
+    
+    assert converter.parse(converter.convert(num)) == num
+    assert converter.parse(converter.convert(-num)) == -num
+
+
+@pytest.mark.parametrize('text', [
+    '', ' ', 'negative', 'negative zero', 'zero zero', 'one thousand one million', 'twenty ten',
+    'one  two', 'One', ' one', 'one ', 'one hundred hundred', 'thousand', 'one thousand zero',
+    'eleven hundred', 'one hundred and one', 'one million thousand', 'negative negative one',
+    'one thousand one thousand', 'twenty-one', 'one zillion',
+])
+def test_rejects_malformed(converter, text):
+    with pytest.raises(ValueError):
+        converter.parse(text)
+
+
+def test_parse_lines(converter):
+    values = list(range(-1005, 5)) + list(range(999990, 1001010)) + [10 ** 40, 7, 10 ** 40 + 3]
+    lines = [converter.convert(v) + '\n' for v in values]
+    lines[-1] = lines[-1].rstrip('\n')  # the last line may lack its newline
+    
+    assert list(converter.parse_lines(lines)) == values
+
+
+def test_parse_lines_prefix_fast_path(converter):
+    # Lines after the first in a block only have their last chunk looked up.
+    calls = []
+    parse = converter.parse
+    lines = [converter.convert(v) for v in range(123000, 125000)]
+    
+    counting = NumberToWords()
+    counting.parse = lambda text: calls.append(text) or parse(text)
+    
+    assert list(counting.parse_lines(lines)) == list(range(123000, 125000))
+    assert calls == [converter.convert(123000), converter.convert(124000)]
+
+
+def test_parse_lines_names_bad_line(converter):
+    lines = [converter.convert(v) for v in range(5000, 5010)]
+    lines[7] = converter.convert(5000) + ' ten ten'
+    
+    with pytest.raises(ValueError, match="Line 8"):
+        list(converter.parse_lines(lines))
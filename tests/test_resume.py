@@ -0,0 +1,93 @@
+# Checkpoints and resuming: prepare_resume keeps the whole lines that match
+# and truncates the rest, wherever the file was cut.
+
+import pytest
+
+from number_words import (NumberToWords, prepare_resume, read_checkpoint, remove_checkpoint,
+                          write_checkpoint)
+
+END = 25000
+
+
+@pytest.fixture
+def converter():
+    return NumberToWords()
+
+
+def write_prefix(converter, path, data, last):
+    # A file holding data, with a checkpoint after line `last`.
+    path.write_bytes(data)
+    write_checkpoint(str(path), END, last, converter.line_offset(last + 1))
+
+
+def finish(converter, path, next_number, end_number):
+    with open(path, 'ab') as f:
+        f.write(converter.encode_many(range(next_number, end_number + 1)))
+
+
+@pytest.mark.parametrize('cut', [1000, 1001, 5000, 9999, 10000, 10001, 20000])
+def test_resume_at_block_boundaries(converter, tmp_path, cut):
+    # Everything after the checkpoint up to line `cut` was written too.
+    path = tmp_path / 'out.txt'
+    write_prefix(converter, path, converter.encode_many(range(1, cut + 1)), 999)
+    
+    next_number, end_number = prepare_resume(converter, str(path))
+    
+    assert (next_number, end_number) == (cut + 1, END)
+    assert path.stat().st_size == converter.line_offset(cut + 1)
+    finish(converter, path, next_number, end_number)
+    assert path.read_bytes() == converter.encode_many(range(1, END + 1))
+
+
+@pytest.mark.parametrize('cut', [1, 8, 15])
+def test_resume_drops_partial_line(converter, tmp_path, cut):
+    path = tmp_path / 'out.txt'
+    data = converter.encode_many(range(1, 3001))
+    write_prefix(converter, path, data[:converter.line_offset(2001) + cut], 1000)
+    
+    assert prepare_resume(converter, str(path)) == (2001, END)
+    assert path.read_bytes() == data[:converter.line_offset(2001)]
+
+
+def test_resume_drops_preallocated_space(converter, tmp_path):
+    path = tmp_path / 'out.txt'
+    data = converter.encode_many(range(1, 4001))
+    write_prefix(converter, path, data + b'\0' * 100000, 3000)
+    
+    assert prepare_resume(converter, str(path)) == (4001, END)
+    assert path.read_bytes() == data
+
+
+def test_resume_stops_at_first_bad_line(converter, tmp_path):
+    path = tmp_path / 'out.txt'
+    data = bytearray(converter.encode_many(range(1, 4001)))
+    data[converter.line_offset(3500)] = ord('X')
+    write_prefix(converter, path, bytes(data), 1000)
+    
+    assert prepare_resume(converter, str(path)) == (3500, END)
+    assert path.stat().st_size == converter.line_offset(3500)
+
+
+def test_resume_rejects_mismatched_checkpoint(converter, tmp_path):
+    path = tmp_path / 'out.txt'
+    data = bytearray(converter.encode_many(range(1, 2001)))
+    data[converter.line_offset(1000)] = ord('X')
+    write_prefix(converter, path, bytes(data), 1000)
+    
+    with pytest.raises(ValueError, match="does not match"):
+        prepare_resume(converter, str(path))
+    
+    # A checkpoint past the end of the file is rejected too.
+    path.write_bytes(converter.encode_many(range(1, 10)))
+    with pytest.raises(ValueError, match="does not match"):
+        prepare_resume(converter, str(path))
+
+
+def test_resume_needs_checkpoint(converter, tmp_path):
+    path = tmp_path / 'out.txt'
+    write_prefix(converter, path, b'', 0)
+    remove_checkpoint(str(path))
+    
+    assert read_checkpoint(str(path)) is None
+    with pytest.raises(ValueError, match="No checkpoint"):
+        prepare_resume(converter, str(path))
@@ -0,0 +1,84 @@
+# Scale names past the built-in tables and the long-integer digit helpers.
+
+import random
+import sys
+
+import pytest
+
+from number_words import (NumberToWords, group_chunks, int_from_digits, int_from_groups,
+                          int_to_digits, scale_index, scale_name)
+
+
+@pytest.mark.parametrize('index, name', [
+    (0, ''), (1, 'thousand'), (2, 'million'), (7, 'sextillion'), (11, 'decillion'),
+    (17, 'sedecillion'), (20, 'novendecillion'), (21, 'vigintillion'),
+    (24, 'tresvigintillion'), (31, 'trigintillion'), (101, 'centillion'),
+    (1001, 'millinillion'), (1002, 'millimillion'),
+])
+def test_known_names(index, name):
+    assert scale_name(index) == name
+    if index:
+        assert scale_index(name) == index
+
+
+def test_scale_index_inverts_scale_name():
+    for index in list(range(1, 2500)) + [10 ** 4, 12345, 10 ** 6, 987654321]:
+        assert scale_index(scale_name(index)) == index, index
+
+
+@pytest.mark.parametrize('name', ['', 'zillion', 'llion', 'Million', 'millions', 'one', 'milliard'])
+def test_scale_index_rejects(name):
+    assert scale_index(name) is None
+
+
+def test_converter_uses_scale_names():
+    converter = NumberToWords()
+    
+    assert converter.convert(1000 ** 101) == 'one centillion'
+    assert converter.scale_word(1001) == 'millinillion'
+
+
+@pytest.fixture
+def unlimited_str():
+    # str() of the expected values needs the 4,300-digit limit lifted.
+    if not hasattr(sys, 'set_int_max_str_digits'):
+        yield
+        return
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+@pytest.mark.parametrize('digits', [10 ** 4, 10 ** 5])
+def test_int_to_digits(unlimited_str, digits):
+    rng = random.Random(digits)
+    for num in (rng.randrange(10 ** (digits - 1), 10 ** digits), 10 ** digits,
+                10 ** digits - 1, 10 ** digits + 1, 2 ** (digits * 3)):
+        text = int_to_digits(num)
+        assert text == str(num)
+        assert int_from_digits(text) == num
+
+
+@pytest.mark.parametrize('num', [0, 1, 9, 10, 2 ** 8192 - 1, 2 ** 8192, 2 ** 8193 + 12345])
+def test_int_to_digits_small_and_boundary(unlimited_str, num):
+    assert int_to_digits(num) == str(num)
+
+
+def test_int_from_digits_leading_zeros():
+    assert int_from_digits('0' * 5000 + '123') == 123
+    assert int_from_digits('1' + '0' * 5000) == 10 ** 5000
+
+
+def test_groups():
+    num = int_from_digits('12' + '345' * 2000)
+    
+    chunks = group_chunks(num)
+    
+    assert chunks[-1] == 12 and set(chunks[:-1]) == {345}
+    assert int_from_groups(chunks) == num
+    # Groups above 999 carry into the next position.
+    assert int_from_groups([1000, 999, 5]) == 1000 + 999 * 1000 + 5 * 10 ** 6
+    assert int_from_groups([]) == 0
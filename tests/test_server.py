@@ -0,0 +1,86 @@
+# The conversion service over a real socket: JSON and streamed bodies,
+# and bad requests.
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from number_words import NumberToWords, int_from_digits
+from number_words_server import ConversionService, make_server
+
+
+@pytest.fixture(scope='module')
+def address():
+    server = make_server(ConversionService(), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[:2]
+    server.shutdown()
+    server.server_close()
+    server.service.close()
+
+
+def post(address, body, content_type, headers=None):
+    connection = http.client.HTTPConnection(*address, timeout=30)
+    headers = dict(headers or {}, **{'Content-Type': content_type})
+    if 'Content-Length' in headers:
+        connection.putrequest('POST', '/convert')
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+    else:
+        connection.request('POST', '/convert', body, headers)
+    response = connection.getresponse()
+    result = response.status, response.read()
+    connection.close()
+    return result
+
+
+def test_json_batch(address):
+    status, data = post(address, json.dumps([1, -22, '1,000,000']), 'application/json')
+    
+    assert status == 200
+    assert json.loads(data) == {'words': ['one', 'negative twenty two', 'one million']}
+
+
+def test_streamed_lines(address):
+    status, data = post(address, b'5\n\n1001\n', 'text/plain')
+    
+    assert status == 200
+    assert data == b'five\none thousand one\n'
+
+
+@pytest.mark.parametrize('content_type', ['text/plain', 'application/x-ndjson'])
+def test_streamed_number_longer_than_a_read(address, content_type):
+    # Lines are read 1 MiB at a time; a longer number must still arrive whole.
+    digits = '3' * ((1 << 20) + 3)
+    body = ('7\n' + (json.dumps(digits) if content_type != 'text/plain' else digits)
+            + '\n8\n').encode()
+    
+    status, data = post(address, body, content_type)
+    
+    lines = data.decode().splitlines()
+    if content_type != 'text/plain':
+        lines = [json.loads(line) for line in lines]
+    assert status == 200
+    assert len(lines) == 3
+    assert lines[0] == 'seven' and lines[2] == 'eight'
+    assert lines[1] == NumberToWords().convert(int_from_digits(digits))
+
+
+def test_streamed_error_line(address):
+    status, data = post(address, b'1\n2\nx\n4\n', 'application/x-ndjson')
+    
+    lines = [json.loads(line) for line in data.decode().splitlines()]
+    assert lines[:2] == ['one', 'two']
+    assert lines[2]['line'] == 3
+
+
+@pytest.mark.parametrize('length', ['abc', '-1', '+5', '1_0'])
+def test_bad_content_length(address, length):
+    status, data = post(address, b'[1]', 'application/json', {'Content-Length': length})
+    
+    assert status == 400
+    assert 'Content-Length' in json.loads(data)['error']
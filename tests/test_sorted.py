@@ -0,0 +1,50 @@
+# write_sorted gives the same bytes as sorting the lines in memory.
+
+import io
+
+import pytest
+
+from number_words import SORT_MEMORY_MIN, NumberToWords, write_sorted
+
+
+def expected(start, stop):
+    lines = NumberToWords().encode_many(range(start, stop)).splitlines(keepends=True)
+    return b''.join(sorted(lines))
+
+
+@pytest.mark.parametrize('start, stop', [(1, 2), (1, 1001), (7, 23456), (999990, 1000010)])
+def test_matches_sorted(tmp_path, start, stop):
+    out = io.BytesIO()
+    
+    assert write_sorted(out, start, stop, temp_dir=str(tmp_path)) == stop - start
+    assert out.getvalue() == expected(start, stop)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_many_runs(tmp_path, workers):
+    # A small budget spills the range as several runs, merged together.
+    out = io.BytesIO()
+    
+    assert write_sorted(out, 1, 60001, 4 << 20, workers, str(tmp_path)) == 60000
+    assert out.getvalue() == expected(1, 60001)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_empty_range(tmp_path):
+    out = io.BytesIO()
+    
+    assert write_sorted(out, 10, 10, temp_dir=str(tmp_path)) == 0
+    assert out.getvalue() == b''
+
+
+def test_budget_below_minimum(tmp_path):
+    with pytest.raises(ValueError, match="at least"):
+        write_sorted(io.BytesIO(), 1, 100, SORT_MEMORY_MIN - 1, temp_dir=str(tmp_path))
+
+
+def test_small_budget_uses_several_merge_passes(tmp_path):
+    # 1M leaves room for only a few runs per merge.
+    out = io.BytesIO()
+    
+    assert write_sorted(out, 1, 150001, SORT_MEMORY_MIN, 4, str(tmp_path)) == 150000
+    assert out.getvalue() == expected(1, 150001)
@@ -0,0 +1,71 @@
+# range_stats against brute force on small ranges at every magnitude,
+# including negatives and zero.
+
+import random
+from collections import Counter
+
+import pytest
+
+from number_words import NumberToWords
+
+
+@pytest.fixture(scope='module')
+def converter():
+    return NumberToWords()
+
+
+def brute_force(converter, start, end):
+    # The same statistics by converting every number in start..end.
+    lines = [converter.convert(num) for num in range(start, end + 1)]
+    words = Counter(word for line in lines for word in line.split(' '))
+    letters = Counter(letter for line in lines for letter in line.replace(' ', ''))
+    lengths = [len(line) for line in lines]
+    return {
+        'lines': len(lines),
+        'bytes': sum(lengths) + len(lines),
+        'words': sum(words.values()),
+        'word_counts': dict(words),
+        'letter_counts': dict(letters),
+        'longest': max(lengths),
+        'shortest': min(lengths),
+    }
+
+
+def check(converter, start, end):
+    result = converter.range_stats(start, end)
+    expected = brute_force(converter, start, end)
+    
+    for key in ('lines', 'bytes', 'words', 'word_counts', 'letter_counts'):
+        assert result[key] == expected[key], (start, end, key)
+    assert result['longest'][0] == expected['longest'], (start, end)
+    assert result['shortest'][0] == expected['shortest'], (start, end)
+    # The witnesses are numbers in the range with exactly those lengths.
+    for length, num in (result['longest'], result['shortest']):
+        assert start <= num <= end, (start, end, num)
+        assert len(converter.convert(num)) == length, (start, end, num)
+
+
+def random_ranges(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        low = rng.randrange(-10 ** rng.randrange(1, 8), 10 ** rng.randrange(1, 25))
+        yield low, low + rng.randrange(0, 2000)
+
+
+@pytest.mark.parametrize('start, end', list(random_ranges(200, 1)))
+def test_random_ranges(converter, start, end):
+    check(converter, start, end)
+
+
+@pytest.mark.parametrize('start, end', [
+    (0, 0), (1, 1), (-1, -1), (-5, 5), (-1000, -990), (1, 1000), (995, 1005),
+    (999999, 1000001), (-10 ** 6 - 3, -10 ** 6 + 3), (10 ** 21 - 5, 10 ** 21 + 5),
+    (10 ** 24 - 1500, 10 ** 24 + 2),
+])
+def test_edges(converter, start, end):
+    check(converter, start, end)
+
+
+def test_empty_range(converter):
+    with pytest.raises(ValueError):
+        converter.range_stats(5, 4)
@@ -0,0 +1,69 @@
+# read_number_batches reads any whitespace-separated input in bounded
+# batches, and names the right line for a bad number.
+
+import io
+
+import pytest
+
+from number_words import NumberToWords, int_from_digits, read_number_batches, write_numbers
+
+
+@pytest.mark.parametrize('separator', [b'\n', b' ', b'\t', b'\r\n', b' \n  '])
+def test_batches_stay_small(separator):
+    values = list(range(-50000, 50000, 3)) + [10 ** 40, -(10 ** 25)]
+    data = separator.join(str(v).encode() for v in values) + b'\n'
+    
+    batches = list(read_number_batches(io.BytesIO(data), chunk_size=1024))
+    
+    assert [v for batch in batches for v in batch] == values
+    assert len(batches) > 100
+    assert max(map(len, batches)) <= 1024 // 2
+
+
+def test_number_longer_than_chunk():
+    digits = '7' * 5000
+    values = [1, int_from_digits(digits), 2]
+    data = b'1 ' + digits.encode() + b' 2'
+    
+    batches = list(read_number_batches(io.BytesIO(data), chunk_size=256))
+    
+    assert [v for batch in batches for v in batch] == values
+
+
+def test_words_and_bad_lines():
+    data = b'12 -7\n3,000\n\n  1_000_042  +5\n'
+    
+    assert [v for batch in read_number_batches(io.BytesIO(data), chunk_size=4)
+            for v in batch] == [12, -7, 3000, 1000042, 5]
+    
+    data = b'1 2 3\n' * 1000 + b'4 x6 7\n'
+    with pytest.raises(ValueError, match="line 1,001"):
+        list(read_number_batches(io.BytesIO(data), chunk_size=100))
+
+
+def test_write_numbers():
+    converter = NumberToWords()
+    out = io.BytesIO()
+    
+    written = write_numbers(out, converter, read_number_batches(io.BytesIO(b'5 1001 -3'), 2))
+    
+    assert written == 3
+    assert out.getvalue() == b'five\none thousand one\nnegative three\n'
+
+
+@pytest.mark.parametrize('start, stop, step', [
+    (1, 10001, 1), (-2500, 2500, 1), (-2500, 2500, 7), (-3000, -5, 999), (999, 3001, 3),
+    (12345, 99999, 997), (1000, 20000, 1000), (5, 4, 1), (10 ** 21 - 3000, 10 ** 21 + 3000, 13),
+])
+@pytest.mark.parametrize('batch_size', [1, 777])
+def test_stepped_batches(start, stop, step, batch_size):
+    converter = NumberToWords()
+    numbers = range(start, stop, step)
+    
+    batches = list(converter.iter_stepped_batches(start, stop, step, batch_size))
+    
+    assert b''.join(data for _, data in batches) == converter.encode_many(numbers)
+    assert [count for count, _ in batches] == [data.count(b'\n') for _, data in batches]
+    assert sum(count for count, _ in batches) == len(numbers)
+    if step == 1:
+        assert b''.join(converter.iter_byte_blocks(start, stop)) == converter.encode_many(numbers)
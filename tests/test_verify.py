@@ -0,0 +1,77 @@
+# verify_file finds the first line that is wrong, missing or left over.
+
+import pytest
+
+from number_words import NumberToWords, verify_file
+
+END = 30000
+
+
+@pytest.fixture
+def expected():
+    return NumberToWords().encode_many(range(1, END + 1))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_intact_file(tmp_path, expected, workers):
+    path = tmp_path / 'out.txt'
+    path.write_bytes(expected)
+    
+    result = verify_file(str(path), end=END, workers=workers, batch_size=1000)
+    
+    assert result['ok']
+    assert result['lines'] == END
+    assert 'mismatch' not in result
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('num', [1, 999, 1000, 1001, 21234, END])
+def test_changed_byte(tmp_path, expected, workers, num):
+    converter = NumberToWords()
+    offset = converter.line_offset(num)
+    data = bytearray(expected)
+    data[offset + 1] ^= 0x20
+    path = tmp_path / 'out.txt'
+    path.write_bytes(bytes(data))
+    
+    result = verify_file(str(path), end=END, workers=workers, batch_size=1000)
+    
+    assert not result['ok']
+    assert result['mismatch']['number'] == num
+    assert result['mismatch']['offset'] == offset
+    assert result['mismatch']['expected'] == converter.convert(num)
+    assert result['mismatch']['found'] != converter.convert(num)
+
+
+def test_missing_line(tmp_path, expected):
+    converter = NumberToWords()
+    path = tmp_path / 'out.txt'
+    path.write_bytes(expected[:converter.line_offset(500)] + expected[converter.line_offset(501):])
+    
+    result = verify_file(str(path), end=END)
+    
+    assert result['mismatch']['number'] == 500
+    assert result['mismatch']['found'] == converter.convert(501)
+
+
+def test_truncated_file(tmp_path, expected):
+    converter = NumberToWords()
+    path = tmp_path / 'out.txt'
+    path.write_bytes(expected[:converter.line_offset(END) + 3])
+    
+    result = verify_file(str(path), end=END)
+    
+    assert not result['ok']
+    assert result['mismatch']['number'] == END
+    assert result['lines'] == END - 1
+
+
+def test_data_left_over(tmp_path, expected):
+    path = tmp_path / 'out.txt'
+    path.write_bytes(expected + b'extra\n')
+    
+    result = verify_file(str(path), end=END)
+    
+    assert not result['ok']
+    assert result['mismatch']['number'] == END + 1
+    assert result['mismatch']['found'] == 'extra'